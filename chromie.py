@@ -1,6 +1,12 @@
 import os
 import json
 import traceback
+import atexit
+import signal
+import gzip
+import bisect
+import mmap
+import io
 from pathlib import Path
 from datetime import datetime, date, timedelta, timezone
 from zoneinfo import ZoneInfo
@@ -14,12 +20,19 @@ from discord import app_commands
 from threading import Lock
 from enum import IntEnum
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 import random
 import re
 import aiohttp
 import difflib
 import hashlib
 from discord.errors import NotFound as DiscordNotFound, Forbidden as DiscordForbidden, HTTPException
+try:
+    import orjson  # optional: C-accelerated (de)serialization of the state file
+except ImportError:
+    orjson = None
+_json_loads = orjson.loads if orjson is not None else json.loads
 # ==========================
 # CONFIG
 # ==========================
@@ -28,7 +41,10 @@ VERSION = "2026-06-21 (lean onboarding: channel-only setup button)"
 
 DEFAULT_TZ = ZoneInfo("America/Chicago")
 UPDATE_INTERVAL_SECONDS = 60
-DEFAULT_MILESTONES = [100, 60, 30, 14, 7, 2, 1, 0]
+UPDATE_GUILD_CONCURRENCY = 8  # guilds processed in parallel per update tick
+# Shared by every event that hasn't customized its ladder. Milestone lists are only
+# ever replaced wholesale, never mutated in place, so events can reference this directly.
+DEFAULT_MILESTONES = (100, 60, 30, 14, 7, 2, 1, 0)
 # Streak (count-UP) milestones in DAYS SINCE the start date. Day 1 is the kickoff;
 # beyond the last entry the engine fires yearly anniversaries forever (see Phase 5).
 # This default ladder is free; Pro users can customize it.
@@ -36,6 +52,10 @@ DEFAULT_STREAK_MILESTONES = [1, 7, 30, 60, 90, 100, 180, 365]
 MILESTONE_CLEANUP_AFTER_EVENT_SECONDS = 86400  # 24 hours
 
 DATA_FILE = Path(os.getenv("CHROMIE_DATA_PATH", "/var/data/chromie_state.json"))
+# Opt-in: gzip the state file on write (load_state reads either form).
+# The file is written compact unless CHROMIE_PRETTY_JSON is set (handy locally).
+STATE_PRETTY_JSON = os.getenv("CHROMIE_PRETTY_JSON", "").strip().lower() in ("1", "true", "yes")
+STATE_GZIP = os.getenv("CHROMIE_STATE_GZIP", "").strip().lower() in ("1", "true", "yes")
 TOKEN = os.getenv("DISCORD_BOT_TOKEN", "").strip()
 
 FAQ_URL = "https://gingeraffee.github.io/chronobot-faq/"
@@ -173,7 +193,7 @@ async def topgg_has_voted(user_id: int, *, force: bool = False) -> bool:
                     voted = True if TOPGG_FAIL_OPEN else False
                 elif resp.status == 200:
                     try:
-                        data = json.loads(text)
+                        data = _json_loads(text)
                         voted = bool(int(data.get("voted", 0) or 0))
                     except Exception:
                         voted = True if TOPGG_FAIL_OPEN else False
@@ -448,7 +468,7 @@ State structure (high level):
     }
   },
   "user_links": {
-    "user_id_str": guild_id_int
+    "user_id_str": guild_id_int      # int-keyed in memory (load_state converts)
   }
 }
 """
@@ -478,10 +498,23 @@ def build_event_start_blast(event_name: str) -> str:
 
 def load_state() -> dict:
     data = {}
-    if DATA_FILE.exists():
+    # An empty file can't be mapped (mmap raises on length 0); treat it as a fresh start
+    # rather than shunting it aside as corrupt.
+    if DATA_FILE.exists() and DATA_FILE.stat().st_size > 0:
         try:
-            with open(DATA_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # mmap the file so orjson parses straight from the page cache rather
+            # than from an intermediate bytes copy of a multi-MB state file.
+            with open(DATA_FILE, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[:2] == b"\x1f\x8b":  # gzip magic
+                    raw = gzip.decompress(mm)
+                elif orjson is not None:
+                    raw = None
+                    with memoryview(mm) as view:
+                        data = orjson.loads(view)
+                else:
+                    raw = mm[:]
+            if raw is not None:
+                data = _json_loads(raw)
         except Exception:
             # Preserve the broken file so data isn't permanently lost
             try:
@@ -494,38 +527,230 @@ def load_state() -> dict:
             data = {}
 
     data.setdefault("guilds", {})
-    data.setdefault("user_links", {})
+    # JSON object keys are always strings; hold user_links keyed by the int user id
+    # in memory so DM lookups don't stringify per call (the dumpers write them back as str).
+    links = data.get("user_links")
+    data["user_links"] = (
+        {int(k) if isinstance(k, str) and k.isdigit() else k: v for k, v in links.items()}
+        if isinstance(links, dict) else {}
+    )
     return data
 
 
+def _event_sort_key(ev: dict):
+    return ev.get("timestamp", 0)
+
+
+_TIMESTAMP_KEY = itemgetter("timestamp")
+
+
 def sort_events(guild_state: dict):
+    """Sort a bucket's events by timestamp, in place.
+
+    Invariant: startup sorts every bucket once, and writers keep the order from
+    then on (insert_event / reposition_event), so readers — commands, the embed
+    builders and the update tick — rely on it without re-sorting."""
     events = guild_state.get("events")
     if not isinstance(events, list):
         events = []
-    events.sort(key=lambda ev: ev.get("timestamp", 0))
+    try:
+        events.sort(key=_TIMESTAMP_KEY)  # C-level key; every writer sets "timestamp"
+    except KeyError:
+        events.sort(key=_event_sort_key)  # an old entry without one sorts as 0
     guild_state["events"] = events
 
 
-def save_state():
+def _json_default(o):
+    # Sets are handy for in-memory membership checks; persist them as sorted lists.
+    if isinstance(o, (set, frozenset)):
+        return sorted(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _dump_state_bytes(data: dict, *, pretty: Optional[bool] = None, compress: Optional[bool] = None) -> bytes:
+    """Serialize state for disk. `pretty`/`compress` default to the
+    CHROMIE_PRETTY_JSON / CHROMIE_STATE_GZIP settings."""
+    pretty = STATE_PRETTY_JSON if pretty is None else pretty
+    compress = STATE_GZIP if compress is None else compress
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches json.dump, which silently stringifies int keys.
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        raw = orjson.dumps(data, default=_json_default, option=option)
+    elif pretty:
+        raw = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode("utf-8")
+    else:
+        raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=_json_default).encode("utf-8")
+    if compress:
+        raw = gzip.compress(raw, compresslevel=6)
+    return raw
+
+
+# Digest of the last payload written, so a save whose serialized state is byte-for-byte
+# what's already on disk (a tick that only re-set defaults, a no-op edit) skips the
+# tmp write + fsync + replace entirely.
+_last_written_digest: Optional[bytes] = None
+
+
+def _write_state_atomic() -> bool:
+    """Serialize `state` and write it to DATA_FILE. Returns True on success."""
+    global _last_written_digest
     with _STATE_LOCK:
         try:
-            DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
+            # Hash before compressing: gzip output embeds a timestamp.
+            raw = _dump_state_bytes(state, compress=False)
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            if digest == _last_written_digest and DATA_FILE.exists():
+                return True
+            if STATE_GZIP:
+                raw = gzip.compress(raw, compresslevel=6)
 
-            tmp_path = DATA_FILE.with_suffix(DATA_FILE.suffix + ".tmp")
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                json.dump(state, f, indent=2)
+            # Never truncate DATA_FILE in place: write a per-process tmp file, fsync
+            # it, then swap it in, so a crash mid-write leaves the old state intact.
+            tmp_path = DATA_FILE.with_name(DATA_FILE.name + f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(raw)
+                f.flush()
+                os.fsync(f.fileno())
 
             os.replace(tmp_path, DATA_FILE)  # atomic on most platforms
-
-            # Clean up if still present (paranoia)
-            if tmp_path.exists():
-                try:
-                    tmp_path.unlink()
-                except Exception:
-                    pass
+            _last_written_digest = digest
+            return True
 
         except Exception as e:
             print(f"[STATE] save_state failed: {type(e).__name__}: {e}")
+            return False
+
+
+# Writes are coalesced: while the bot is running, save_state() only marks the
+# state dirty and wakes flush_state(), which waits STATE_FLUSH_DEBOUNCE_SECONDS
+# so a burst of commands/sends lands in a single write, then writes from a
+# worker thread. Before the loop starts (import/migration, tests) saves stay
+# synchronous.
+STATE_FLUSH_DEBOUNCE_SECONDS = 2
+_state_dirty = False
+_state_dirty_event = asyncio.Event()
+
+
+def mark_state_dirty():
+    """Queue a state write without doing it now (see flush_state)."""
+    global _state_dirty
+    _state_dirty = True
+    _state_dirty_event.set()
+
+
+def insert_event(bucket: dict, ev: dict):
+    """Append `ev` to a bucket at its timestamp position (O(log n) search)."""
+    events = bucket.get("events")
+    if not isinstance(events, list):
+        events = bucket["events"] = []
+    bisect.insort_right(events, ev, key=_event_sort_key)
+
+
+def reposition_event(bucket: dict, ev: dict):
+    """Re-slot `ev` (matched by identity) after its timestamp changed. Leaves the
+    list untouched when the new timestamp still fits between its neighbours."""
+    events = bucket.get("events", [])
+    for i, other in enumerate(events):
+        if other is ev:
+            key = _event_sort_key(ev)
+            if (i == 0 or _event_sort_key(events[i - 1]) <= key) and (
+                i + 1 == len(events) or key <= _event_sort_key(events[i + 1])
+            ):
+                return
+            del events[i]
+            break
+    insert_event(bucket, ev)
+
+
+def _has_timestamp(ev: dict) -> bool:
+    return isinstance(ev.get("timestamp"), (int, float))
+
+
+def bisect_events(events: list, ts: float, *, right: bool = False, fallback=0):
+    """Index splitting a sorted bucket at `ts`: everything before it has a timestamp
+    < ts (<= ts with right=True). A malformed timestamp in old state makes the
+    comparison raise; then the list can't be trusted as sorted and `fallback` is
+    returned instead, for the caller to scan per event."""
+    try:
+        if right:
+            return bisect.bisect_right(events, ts, key=_event_sort_key)
+        return bisect.bisect_left(events, ts, key=_event_sort_key)
+    except TypeError:
+        return fallback
+
+
+def count_events_before(events: list, ts: float, *, inclusive: bool = False) -> int:
+    """How many events have a timestamp < ts (<= ts with inclusive=True)."""
+    n = bisect_events(events, ts, right=inclusive, fallback=None)
+    if n is None:
+        n = sum(
+            1 for ev in events
+            if _has_timestamp(ev) and (ev["timestamp"] <= ts if inclusive else ev["timestamp"] < ts)
+        )
+    return n
+
+
+def first_event_after(events: list, ts: float, *, inclusive: bool = False) -> Optional[dict]:
+    """The earliest event with a timestamp > ts (>= ts with inclusive=True), or None."""
+    i = bisect_events(events, ts, right=not inclusive, fallback=None)
+    if i is not None and (i == len(events) or _has_timestamp(events[i])):
+        return events[i] if i < len(events) else None
+    upcoming = [
+        ev for ev in events
+        if _has_timestamp(ev) and (ev["timestamp"] >= ts if inclusive else ev["timestamp"] > ts)
+    ]
+    return min(upcoming, key=_TIMESTAMP_KEY, default=None)
+
+
+def save_state(force: bool = False):
+    """Persist `state`. While the flush_state task runs this only marks state dirty,
+    so any number of calls in a tick (per-event sends, per-channel cycles, digest)
+    coalesce into one debounced background write. Before the task starts, after it
+    stops, or with force=True, it writes synchronously — that fallback is the safety
+    net if the flusher ever dies."""
+    global _state_dirty
+    if not force and flush_state.is_running():
+        mark_state_dirty()
+        return
+    _state_dirty = False
+    if not _write_state_atomic():
+        _state_dirty = True
+
+
+async def save_state_async():
+    """Write state now (like save_state(force=True)) but on a worker thread, so
+    the gateway heartbeat isn't held up by disk I/O. Use from coroutines that
+    need the write to have landed before they continue."""
+    global _state_dirty
+    _state_dirty = False
+    if not await asyncio.to_thread(_write_state_atomic):
+        mark_state_dirty()
+
+
+@tasks.loop(seconds=0)
+async def flush_state():
+    global _state_dirty
+    await _state_dirty_event.wait()
+    await asyncio.sleep(STATE_FLUSH_DEBOUNCE_SECONDS)
+    _state_dirty_event.clear()
+    if not _state_dirty:
+        return
+    _state_dirty = False
+    # The event loop keeps mutating `state` while the thread serializes it; a
+    # failed write (e.g. "dict changed size") just re-queues another attempt.
+    if not await asyncio.to_thread(_write_state_atomic):
+        mark_state_dirty()
+
+
+def flush_state_now():
+    """Synchronously write any pending changes (shutdown / atexit)."""
+    if _state_dirty:
+        save_state(force=True)
+
+
+atexit.register(flush_state_now)
 
 
 # ==========================
@@ -637,17 +862,124 @@ def should_send_reminder_based_on_time(ev: dict, now: datetime, event_dt: dateti
     return now_time >= reminder_time
 
 
-def get_guild_timezone(guild_state: dict) -> ZoneInfo:
-    tz_name = (guild_state.get("timezone") or "UTC").strip()
+@lru_cache(maxsize=512)
+def resolve_timezone(tz_name: str) -> Optional[ZoneInfo]:
+    """Cached IANA name -> ZoneInfo, or None if the name isn't a valid zone.
+    Used both to validate user input and to render, so a zone that passes
+    validation is exactly the object every later render reuses."""
     try:
         return ZoneInfo(tz_name)
     except Exception:
-        return DEFAULT_TZ
+        return None
+
+
+def _zoneinfo_for(tz_name: str) -> ZoneInfo:
+    return resolve_timezone(tz_name) or DEFAULT_TZ
+
+
+def get_guild_timezone(guild_state: dict) -> ZoneInfo:
+    tz_name = (guild_state.get("timezone") or "UTC").strip()
+    return _zoneinfo_for(tz_name)
+
+
+def _default_guild_state() -> dict:
+    """A fresh guild record with every top-level field present."""
+    return {
+        "event_channel_id": None,
+        "pinned_message_id": None,
+        "mention_role_id": None,
+        "events": [],
+        "welcomed": False,
+
+        # NEW (audit)
+        "event_channel_set_by": None,
+        "event_channel_set_at": None,
+
+        # NEW (supporter features)
+        "theme": DEFAULT_THEME_ID,
+        "countdown_title_override": None,
+        "countdown_description_override": None,
+        "default_milestones": DEFAULT_MILESTONES,
+        "templates": {},  # { "name_key": {...template...} }
+        "digest": {
+            "enabled": False,
+            "channel_id": None,
+            "last_sent_date": None,  # "YYYY-MM-DD"
+        },
+        
+        # NEW (supporter/pro tracking - from spec)
+        "supporter": {
+            "last_vote_at": None,
+            "vote_until": None
+        },
+        "pro": {
+            "pro_active": False,
+            "pro_until": None,
+            "grace_until": None,
+            "migration_mode": False  # Disabled - tier limits now enforced
+        },
+        "auto_delete_milestones": True,
+        "time_unit": "discord",
+
+        # Per-channel countdowns scaffolding (see migrate_per_channel.py).
+        # Legacy fields above stay for now; the command sweep moves event/
+        # display data into per-channel buckets here.
+        "channels": {},
+    }
+
+
+def apply_guild_defaults(g_state: dict) -> dict:
+    """Backfill any top-level guild fields missing from an older save, in place."""
+    for key, default in _default_guild_state().items():
+        g_state.setdefault(key, default)
+    return g_state
+
+
+def _default_channel_state() -> dict:
+    """A fresh per-channel countdown bucket with sensible defaults."""
+    return {
+        "pinned_message_id": None,
+        "mention_role_id": None,
+        "events": [],
+        "event_channel_set_by": None,
+        "event_channel_set_at": None,
+        "theme": DEFAULT_THEME_ID,
+        "countdown_title_override": None,
+        "countdown_description_override": None,
+        "default_milestones": DEFAULT_MILESTONES,
+        "digest": {"enabled": False, "channel_id": None, "last_sent_date": None},
+        "auto_delete_milestones": True,
+        "time_unit": "discord",
+        "timezone": "UTC",
+        "custom_theme": None,  # Pro build-your-own: {title, subtitle, footer, color(int), emoji}
+        "kind": "countdown",   # "countdown" (default) or "streak" — set by /seteventchannel vs /setstreakchannel
+    }
+
+
+_CHANNEL_STATE_KEYS = frozenset(_default_channel_state())
+
+
+def apply_channel_defaults(cs: dict) -> dict:
+    """Backfill any fields missing from an older channel bucket, in place. Buckets
+    are normalized once at startup, so on the access path this is just a key check."""
+    missing = _CHANNEL_STATE_KEYS.difference(cs)
+    if missing:
+        defaults = _default_channel_state()
+        for key in missing:
+            cs[key] = defaults[key]
+    return cs
+
 
 # ==========================
 # STATE INIT (must exist globally)
 # ==========================
 
+# The data directory is created once here rather than on every write.
+try:
+    DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
+except OSError as e:
+    print(f"[STATE] Could not create {DATA_FILE.parent}: {type(e).__name__}: {e}")
+
 state = load_state()
 
 # MIGRATION: per-channel data model. Idempotent + self-backing-up. We run this
@@ -661,99 +993,42 @@ except Exception as _mig_err:
     print(f"[MIGRATION] per-channel migration error at startup: {type(_mig_err).__name__}: {_mig_err}")
 
 # MIGRATION: Disable migration_mode for all guilds to enforce tier limits
+# Single startup pass over every guild: backfill missing fields, establish the
+# sorted-events invariant, and disable migration_mode to enforce tier limits.
 migration_applied = False
+_DEFAULT_MILESTONES_LIST = list(DEFAULT_MILESTONES)
 for guild_id_str, g_state in state.get("guilds", {}).items():
+    apply_guild_defaults(g_state)  # guarantees g_state["pro"] exists
     sort_events(g_state)
-    
-    # Ensure pro structure exists and disable migration_mode
-    if "pro" not in g_state:
-        g_state["pro"] = {
-            "pro_active": False,
-            "pro_until": None,
-            "grace_until": None,
-            "migration_mode": False
-        }
-        migration_applied = True
-    elif g_state["pro"].get("migration_mode", False):
-        # Disable migration_mode to enforce tier limits
+    for _cs in (g_state.get("channels") or {}).values():
+        if isinstance(_cs, dict):
+            apply_channel_defaults(_cs)  # guarantees _cs["events"] exists
+            sort_events(_cs)
+            # JSON gives every event its own copy of the default ladder; point the
+            # unedited ones back at the shared tuple (writers only ever reassign it).
+            for _ev in _cs["events"]:
+                if _ev.get("milestones") == _DEFAULT_MILESTONES_LIST:
+                    _ev["milestones"] = DEFAULT_MILESTONES
+
+    if g_state["pro"].get("migration_mode", False):
         g_state["pro"]["migration_mode"] = False
         migration_applied = True
         print(f"[MIGRATION] Disabled migration_mode for guild {guild_id_str}")
 
 if migration_applied:
     print("[MIGRATION] Tier limits now enforced for all guilds")
-    save_state()
-else:
-    save_state()
+save_state()
 
 
 def get_guild_state(guild_id: int) -> dict:
+    """Plain lookup (creating a fresh guild on first use). Older saved guilds are
+    backfilled once at startup by apply_guild_defaults, not on every access."""
     gid = str(guild_id)
     guilds = state.setdefault("guilds", {})
-    if gid not in guilds:
-        guilds[gid] = {
-            "event_channel_id": None,
-            "pinned_message_id": None,
-            "mention_role_id": None,
-            "events": [],
-            "welcomed": False,
-
-            # NEW (audit)
-            "event_channel_set_by": None,
-            "event_channel_set_at": None,
-
-            # NEW (supporter features)
-            "theme": DEFAULT_THEME_ID,
-            "countdown_title_override": None,
-            "countdown_description_override": None,
-            "default_milestones": DEFAULT_MILESTONES.copy(),
-            "templates": {},  # { "name_key": {...template...} }
-            "digest": {
-                "enabled": False,
-                "channel_id": None,
-                "last_sent_date": None,  # "YYYY-MM-DD"
-            },
-            
-            # NEW (supporter/pro tracking - from spec)
-            "supporter": {
-                "last_vote_at": None,
-                "vote_until": None
-            },
-            "pro": {
-                "pro_active": False,
-                "pro_until": None,
-                "grace_until": None,
-                "migration_mode": False  # Disabled - tier limits now enforced
-            },
-            "auto_delete_milestones": True,
-            "time_unit": "discord",
-
-            # Per-channel countdowns scaffolding (see migrate_per_channel.py).
-            # Legacy fields above stay for now; the command sweep moves event/
-            # display data into per-channel buckets here.
-            "channels": {},
-        }
-
-    else:
-        guilds[gid].setdefault("event_channel_id", None)
-        guilds[gid].setdefault("pinned_message_id", None)
-        guilds[gid].setdefault("mention_role_id", None)
-        guilds[gid].setdefault("events", [])
-        guilds[gid].setdefault("welcomed", False)
-        guilds[gid].setdefault("event_channel_set_by", None)
-        guilds[gid].setdefault("event_channel_set_at", None)
-        guilds[gid].setdefault("theme", DEFAULT_THEME_ID)
-        guilds[gid].setdefault("countdown_title_override", None)
-        guilds[gid].setdefault("countdown_description_override", None)
-        guilds[gid].setdefault("default_milestones", DEFAULT_MILESTONES.copy())
-        guilds[gid].setdefault("templates", {})
-        guilds[gid].setdefault("digest", {"enabled": False, "channel_id": None, "last_sent_date": None})
-        guilds[gid].setdefault("supporter", {"last_vote_at": None, "vote_until": None})
-        guilds[gid].setdefault("pro", {"pro_active": False, "pro_until": None, "grace_until": None, "migration_mode": False})
-        guilds[gid].setdefault("auto_delete_milestones", True)
-        guilds[gid].setdefault("time_unit", "discord")
-        guilds[gid].setdefault("channels", {})  # per-channel countdowns scaffolding
-    return guilds[gid]
+    g = guilds.get(gid)
+    if g is None:
+        g = guilds[gid] = _default_guild_state()
+    return g
 
 
 # ==========================
@@ -773,27 +1048,6 @@ FREE_CHANNEL_LIMIT = 1  # free servers get exactly one countdown channel
 FREE_STREAK_CHANNEL_LIMIT = 1  # free servers also get exactly one streak channel (its own slot)
 
 
-def _default_channel_state() -> dict:
-    """A fresh per-channel countdown bucket with sensible defaults."""
-    return {
-        "pinned_message_id": None,
-        "mention_role_id": None,
-        "events": [],
-        "event_channel_set_by": None,
-        "event_channel_set_at": None,
-        "theme": DEFAULT_THEME_ID,
-        "countdown_title_override": None,
-        "countdown_description_override": None,
-        "default_milestones": DEFAULT_MILESTONES.copy(),
-        "digest": {"enabled": False, "channel_id": None, "last_sent_date": None},
-        "auto_delete_milestones": True,
-        "time_unit": "discord",
-        "timezone": "UTC",
-        "custom_theme": None,  # Pro build-your-own: {title, subtitle, footer, color(int), emoji}
-        "kind": "countdown",   # "countdown" (default) or "streak" — set by /seteventchannel vs /setstreakchannel
-    }
-
-
 def get_channel_state(guild_id: int, channel_id: int) -> dict:
     """
     Return the per-channel countdown bucket for (guild_id, channel_id),
@@ -806,8 +1060,7 @@ def get_channel_state(guild_id: int, channel_id: int) -> dict:
     if cid not in channels:
         channels[cid] = _default_channel_state()
     else:
-        for key, default in _default_channel_state().items():
-            channels[cid].setdefault(key, default)
+        apply_channel_defaults(channels[cid])
     return channels[cid]
 
 
@@ -913,29 +1166,96 @@ def no_channel_guidance(guild_state: dict, action_cmd: str) -> str:
     )
 
 
-def get_user_links() -> dict:
+def get_user_links() -> Dict[int, int]:
     return state.setdefault("user_links", {})
 
 
-def _today_local_date(tz: ZoneInfo = DEFAULT_TZ) -> date:
-    return datetime.now(tz).date()
-
-
 def calendar_days_left(dt: datetime, now: Optional[datetime] = None) -> int:
     if now is None:
         now = datetime.now(dt.tzinfo or DEFAULT_TZ)
     return (dt.date() - now.date()).days
 
 
-def compute_time_left(now: datetime, target_dt: datetime) -> tuple[str, int, bool]:
+SECONDS_PER_DAY = 86400
+SECONDS_PER_HOUR = 3600
+
+# unit -> (singular, plural); indexed by `n != 1` so the countdown text skips
+# rebuilding "day"/"days" strings for every event on every tick.
+_PLURAL_UNITS = {u: (u, u + "s") for u in ("minute", "hour", "day", "week", "month")}
+
+
+def _plural(n: int, unit: str) -> str:
+    return _PLURAL_UNITS[unit][n != 1]
+
+
+# Long-form dates are built from the fields directly: strftime's %B/%p go through the
+# C locale on every call (and would follow a non-English locale); the bot is English-only.
+_MONTHS = ("January", "February", "March", "April", "May", "June", "July",
+           "August", "September", "October", "November", "December")
+
+
+def format_long_date(dt) -> str:
+    """'January 05, 2026' — same output as strftime("%B %d, %Y")."""
+    return f"{_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year}"
+
+
+def format_long_datetime(dt: datetime) -> str:
+    """'January 05, 2026 at 08:30 PM CST' — same output as strftime("%B %d, %Y at %I:%M %p %Z")."""
+    hour = dt.hour % 12 or 12
+    ampm = "AM" if dt.hour < 12 else "PM"
+    return f"{format_long_date(dt)} at {hour:02d}:{dt.minute:02d} {ampm} {dt.tzname() or ''}"
+
+
+# The exact field patterns _strptime compiles for "%m/%d/%Y" and "%H:%M" (note %d's
+# " 5" form and \d matching any Unicode decimal digit), so these parsers accept and
+# reject the same inputs strptime did, minus its per-call format/locale/cache work.
+# The "\s*" ends stand in for the "\s+" strptime matched across the joined
+# f"{date} {time}" string.
+_MDY_PATTERN = r"(1[0-2]|0[1-9]|[1-9])/(3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])/(\d\d\d\d)"
+_HM_PATTERN = r"(2[0-3]|[0-1]\d|\d):([0-5]\d|\d)"
+_DATE_RE = re.compile(_MDY_PATTERN)
+_DATE_BEFORE_TIME_RE = re.compile(_MDY_PATTERN + r"\s*")
+_TIME_AFTER_DATE_RE = re.compile(r"\s*" + _HM_PATTERN)
+
+
+def _date_fields(date_str: str, pattern: "re.Pattern") -> Tuple[int, int, int]:
+    m = pattern.fullmatch(date_str)
+    if m is None:
+        raise ValueError(f"not MM/DD/YYYY: {date_str!r}")
+    month, day, year = m.groups()
+    return int(year), int(month), int(day)
+
+
+def parse_event_date(date_str: str, tz) -> datetime:
+    """MM/DD/YYYY (1- or 2-digit month/day, like strptime's %m/%d) at midnight in `tz`.
+    Accepts exactly what strptime("%m/%d/%Y") did; raises ValueError the same way."""
+    return datetime(*_date_fields(date_str, _DATE_RE), tzinfo=tz)
+
+
+def parse_event_datetime(date_str: str, time_str: str, tz) -> datetime:
+    """MM/DD/YYYY + 24-hour HH:MM in `tz`; same acceptance as strptime("%m/%d/%Y %H:%M")
+    on the joined string, without the _strptime machinery or the join."""
+    m = _TIME_AFTER_DATE_RE.fullmatch(time_str)
+    if m is None:
+        raise ValueError(f"not HH:MM: {time_str!r}")
+    hour, minute = m.groups()
+    return datetime(*_date_fields(date_str, _DATE_BEFORE_TIME_RE), int(hour), int(minute), tzinfo=tz)
+
+
+# Owner-DM texts for the reminder loop (built once, filled per send).
+_MILESTONE_DM_TEMPLATE = "⏰ Milestone: **{name}** is in **{days} {unit}** (on {when})."
+_REPEAT_DM_TEMPLATE = "🔁 Repeat reminder: **{name}** is in **{time_left}** (on {when})."
+
+
+def describe_time_left(total_seconds: int) -> tuple[str, int, bool]:
     """
-    Return (human_string, days_until_or_since, is_past).
+    Return (human_string, days_until_or_since, is_past) for an epoch delta
+    (target_ts - now_ts).
 
     Human string intentionally uses only days/hours/minutes (no seconds)
-    to keep pinned messages compact.
+    to keep pinned messages compact. Taking plain seconds lets hot loops read
+    the clock once and skip building aware datetimes per event.
     """
-    delta = target_dt - now
-    total_seconds = int(delta.total_seconds())
     is_past = total_seconds < 0
 
     total_seconds_abs = abs(total_seconds)
@@ -946,31 +1266,32 @@ def compute_time_left(now: datetime, target_dt: datetime) -> tuple[str, int, boo
         days = 0
         return (f"Happened {desc} ago", days, True) if is_past else (desc, days, False)
 
-    days, rem = divmod(total_seconds_abs, 86400)
-    hours, rem = divmod(rem, 3600)
+    days, rem = divmod(total_seconds_abs, SECONDS_PER_DAY)
+    hours, rem = divmod(rem, SECONDS_PER_HOUR)
     minutes, _ = divmod(rem, 60)
 
     parts: list[str] = []
     if days:
-        parts.append(f"{days} day{'s' if days != 1 else ''}")
+        parts.append(f"{days} {_plural(days, 'day')}")
     if hours or days:
-        parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
+        parts.append(f"{hours} {_plural(hours, 'hour')}")
     # Always show minutes once we're above 1 minute
-    parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
+    parts.append(f"{minutes} {_plural(minutes, 'minute')}")
 
     desc = " • ".join(parts)
     if is_past:
         return f"Happened {desc} ago", days, True
     return desc, days, False
 
+
 def format_time_unit(total_seconds: int, unit: str) -> str:
     """Format a positive duration in the requested unit for pinned embed display."""
-    days = total_seconds // 86400
+    days = total_seconds // SECONDS_PER_DAY
     if unit == "days":
-        return f"{days} day{'s' if days != 1 else ''}"
+        return f"{days} {_plural(days, 'day')}"
     if unit == "weeks":
         weeks = days // 7
-        return f"{weeks} week{'s' if weeks != 1 else ''}"
+        return f"{weeks} {_plural(weeks, 'week')}"
     if unit == "detailed":
         months = days // 30
         rem = days % 30
@@ -978,17 +1299,22 @@ def format_time_unit(total_seconds: int, unit: str) -> str:
         rem_days = rem % 7
         parts = []
         if months:
-            parts.append(f"{months} month{'s' if months != 1 else ''}")
+            parts.append(f"{months} {_plural(months, 'month')}")
         if weeks:
-            parts.append(f"{weeks} week{'s' if weeks != 1 else ''}")
+            parts.append(f"{weeks} {_plural(weeks, 'week')}")
         if rem_days:
-            parts.append(f"{rem_days} day{'s' if rem_days != 1 else ''}")
+            parts.append(f"{rem_days} {_plural(rem_days, 'day')}")
         if not parts:
-            return f"{days} day{'s' if days != 1 else ''}"
+            return f"{days} {_plural(days, 'day')}"
         if len(parts) == 1:
             return parts[0]
         return ", ".join(parts[:-1]) + f" and {parts[-1]}"
-    return f"{days} day{'s' if days != 1 else ''}"
+    return f"{days} {_plural(days, 'day')}"
+
+
+def event_milestones(ev: dict):
+    """The event's milestone ladder (the shared DEFAULT_MILESTONES unless customized)."""
+    return ev.get("milestones", DEFAULT_MILESTONES)
 
 
 def parse_milestones(text: str) -> Optional[List[int]]:
@@ -1002,21 +1328,17 @@ def parse_milestones(text: str) -> Optional[List[int]]:
     if not text or not text.strip():
         return None
 
-    cleaned = text.replace(",", " ").replace(";", " ").strip()
-    parts = [p for p in cleaned.split() if p.strip()]
-
-    out: List[int] = []
+    seen = set()
     try:
-        for p in parts:
+        for p in text.replace(",", " ").replace(";", " ").split():
             n = int(p)
             if n < 0 or n > 5000:
                 return None
-            out.append(n)
+            seen.add(n)
     except ValueError:
         return None
 
-    out = sorted(set(out), reverse=True)
-    return out
+    return sorted(seen, reverse=True)
 
 
 # How long to keep events after they start (so start blast doesn’t delete them immediately)
@@ -1032,16 +1354,22 @@ def prune_past_events(guild_state: dict, now: Optional[datetime] = None) -> int:
     # Keep window must be at least the start-blast grace window
     keep_seconds = max(STARTED_EVENT_KEEP_SECONDS, EVENT_START_GRACE_SECONDS)
 
-    sort_events(guild_state)
     events = guild_state.get("events", [])
     if not isinstance(events, list) or not events:
         guild_state["events"] = [] if not isinstance(events, list) else events
         return 0
 
+    cutoff_ts = now.timestamp() - keep_seconds
+    # Sorted by timestamp, so only the prefix before the cutoff can hold prunable
+    # events — usually empty, making the per-minute call O(log n) with no rebuild.
+    cut = bisect_events(events, cutoff_ts, fallback=len(events))  # unsortable: scan everything
+    if cut == 0:
+        return 0
+
     kept: list[dict] = []
     removed = 0
 
-    for ev in events:
+    for ev in events[:cut]:
         # Streaks count UP from a start date and are intentionally "in the past" —
         # they have no end and must never be swept by countdown pruning.
         if is_streak_event(ev):
@@ -1052,24 +1380,14 @@ def prune_past_events(guild_state: dict, now: Optional[datetime] = None) -> int:
             kept.append(ev)
             continue
 
-        try:
-            dt = datetime.fromtimestamp(ts, tz=tz)
-        except Exception:
-            kept.append(ev)
-            continue
-
-        if dt <= now:
-            age = (now - dt).total_seconds()
-            if age <= keep_seconds:
-                kept.append(ev)
-            else:
-                removed += 1
+        if ts < cutoff_ts:
+            removed += 1
         else:
             kept.append(ev)
 
     if removed:
-        guild_state["events"] = kept
-        sort_events(guild_state)
+        kept.extend(events[cut:])
+        guild_state["events"] = kept  # filtered in order, so still sorted
 
     return removed
 async def cleanup_milestones_if_due(guild_state: dict, ev: dict):
@@ -1098,7 +1416,7 @@ async def cleanup_milestones_if_due(guild_state: dict, ev: dict):
         return
 
     for item in msgs:
-        ch = bot.get_channel(int(item.get("channel_id", 0)))
+        ch = cached_text_channel(int(item.get("channel_id", 0)))
         mid = int(item.get("message_id", 0))
         if not isinstance(ch, discord.TextChannel) or mid <= 0:
             continue
@@ -1208,7 +1526,7 @@ async def sync_discord_subscription(guild_id: int) -> bool:
 # Owner-only commands are hidden from the 600+ public servers by registering them
 # ONLY in the dev guild (DEV_GUILD_ID). They're defined globally at import (so
 # they're easy to find), then relocated to the dev guild in setup_hook below.
-OWNER_ONLY_COMMANDS = {"announce_update", "prune_state", "owner_unlock"}
+OWNER_ONLY_COMMANDS = {"announce_update", "prune_state", "owner_unlock", "export_state"}
 
 
 class ChromieBot(commands.Bot):
@@ -1265,11 +1583,29 @@ class ChromieBot(commands.Bot):
         except Exception as e:
             print(f"Error registering persistent views (setup_hook): {e}")
 
+        if not flush_state.is_running():
+            flush_state.start()
+        # A plain SIGTERM (systemd / docker stop) kills the process without running
+        # atexit, dropping whatever flush_state hadn't written yet. Route it through
+        # close(), which flushes first. (Not available on Windows event loops.)
+        try:
+            asyncio.get_running_loop().add_signal_handler(
+                signal.SIGTERM, lambda: spawn_background(self.close())
+            )
+        except (NotImplementedError, RuntimeError):
+            pass
         if not update_countdowns.is_running():
             update_countdowns.start()
         if not weekly_digest_loop.is_running():
             weekly_digest_loop.start()
 
+    async def close(self):
+        # Stop batching and write whatever is still pending before disconnecting.
+        if flush_state.is_running():
+            flush_state.cancel()
+        flush_state_now()
+        await super().close()
+
 
 bot = ChromieBot(command_prefix="!", intents=intents)
 
@@ -1366,6 +1702,29 @@ def build_perm_howto(channel: discord.abc.GuildChannel, missing: list[str]) -> s
     )
 
 
+# owner_id -> User from a REST fetch. Without the members intent guild.owner is
+# usually None, and every owner notice used to pay a fetch_user round trip.
+_owner_users: Dict[int, discord.User] = {}
+
+
+async def get_guild_owner(guild: discord.Guild):
+    """The guild owner as a Member/User we can DM, or None if it can't be resolved."""
+    owner = guild.owner
+    if owner is not None:
+        return owner
+    owner_id = guild.owner_id
+    if not owner_id:
+        return None
+    owner = _owner_users.get(owner_id) or bot.get_user(owner_id)
+    if owner is None:
+        try:
+            owner = await bot.fetch_user(owner_id)
+        except Exception:
+            return None
+    _owner_users[owner_id] = owner
+    return owner
+
+
 async def notify_owner_missing_perms(
     guild: discord.Guild,
     channel: Optional[discord.abc.GuildChannel],
@@ -1406,12 +1765,7 @@ async def notify_owner_missing_perms(
     text = header + howto + footer
 
     # Try DM owner
-    owner = guild.owner
-    if owner is None:
-        try:
-            owner = await bot.fetch_user(guild.owner_id)
-        except Exception:
-            owner = None
+    owner = await get_guild_owner(guild)
 
     sent = False
     if owner:
@@ -1449,7 +1803,7 @@ async def notify_event_channel_changed(
     new_channel: discord.TextChannel,
 ):
     """Notify owner + optionally post a lightweight audit message when event channel changes."""
-    when = datetime.now(DEFAULT_TZ).strftime("%B %d, %Y at %I:%M %p %Z")
+    when = format_long_datetime(datetime.now(DEFAULT_TZ))
 
     old_ch_mention = "(not set)"
     if old_channel_id:
@@ -1467,12 +1821,7 @@ async def notify_event_channel_changed(
     )
 
     # ---- DM server owner (primary) ----
-    owner = guild.owner
-    if owner is None:
-        try:
-            owner = await bot.fetch_user(guild.owner_id)
-        except Exception:
-            owner = None
+    owner = await get_guild_owner(guild)
 
     if owner:
         try:
@@ -1528,10 +1877,7 @@ async def _first_sendable_channel(guild: discord.Guild) -> Optional[discord.Text
 
     if guild.system_channel is not None and _ok(guild.system_channel):
         return guild.system_channel
-    for ch in guild.text_channels:
-        if _ok(ch):
-            return ch
-    return None
+    return next((ch for ch in guild.text_channels if _ok(ch)), None)
 
 
 async def send_onboarding_for_guild(guild: discord.Guild):
@@ -1565,7 +1911,7 @@ async def send_onboarding_for_guild(guild: discord.Guild):
     # `could_post` is now the single "did onboarding land?" signal (dm_sent retired).
     guild_state["onboarding"] = {"could_post": setup_channel is not None}
     guild_state["welcomed"] = True
-    save_state()
+    await save_state_async()
 
 
 async def notify_owner_countdown_unpinned(
@@ -1597,12 +1943,7 @@ async def notify_owner_countdown_unpinned(
     )
 
     # Try DM owner
-    owner = guild.owner
-    if owner is None:
-        try:
-            owner = await bot.fetch_user(guild.owner_id)
-        except Exception:
-            owner = None
+    owner = await get_guild_owner(guild)
 
     sent = False
     if owner:
@@ -1759,7 +2100,6 @@ async def on_guild_join(guild: discord.Guild):
         f"➕ **Joined** {guild.name} (`{guild.id}`) — now in **{len(bot.guilds)}** servers."
     )
     g_state = get_guild_state(guild.id)
-    sort_events(g_state)
     g_state["joined_at"] = time.time()  # for churn diagnostics when a server later leaves
     # Snapshot name + size now: on leave Discord may hand us only a partial guild
     # object (no cached name/member_count), so the churn log falls back to these.
@@ -1927,6 +2267,8 @@ async def on_guild_remove(guild: discord.Guild):
         f"{engagement} {onboarding} "
         f"Now in **{len(bot.guilds)}** servers."
     )
+    for cid in [cid for cid, ch in _text_channels.items() if ch.guild.id == guild.id]:
+        forget_channel_caches(cid)
     # Let a returning server get a fresh welcome + setup button if they re-add later.
     # Their countdowns/streaks/config are preserved — only the welcome flag resets.
     g["welcomed"] = False
@@ -1948,6 +2290,14 @@ async def on_guild_remove(guild: discord.Guild):
             print(f"⚠️ Error updating Top.gg on guild remove: {e}")
 
 
+@bot.event
+async def on_guild_channel_delete(channel):
+    """Drop the per-channel memos for a deleted channel and mark it unresolvable, so
+    the update loop doesn't re-fetch it every tick or fire a queued rebuild into it."""
+    forget_channel_caches(channel.id)
+    _channel_miss_at[channel.id] = time.monotonic()
+
+
 # ==========================
 # EMBED HELPERS
 # ==========================
@@ -2165,8 +2515,22 @@ HELP_OPTIONS = [
 ]
 
 
+# The help pages are static: join each page's command lines (and the links footer)
+# once at import instead of on every /chronohelp and page switch.
+_HELP_COMMANDS_TEXT = {key: "\n".join(page["lines"]) for key, page in HELP_PAGES.items()}
+# Keep links out of the main text so it stays readable
+_HELP_FOOTER = " • ".join(
+    link for link in (
+        f"FAQ: {FAQ_URL}" if FAQ_URL else "",
+        f"Support: {SUPPORT_SERVER_URL}" if SUPPORT_SERVER_URL else "",
+    ) if link
+)
+
+
 def build_help_embed(page_key: str) -> discord.Embed:
-    page = HELP_PAGES.get(page_key, HELP_PAGES["quick"])
+    if page_key not in HELP_PAGES:
+        page_key = "quick"
+    page = HELP_PAGES[page_key]
     e = discord.Embed(
         title=page["title"],
         description=page["desc"],
@@ -2175,18 +2539,12 @@ def build_help_embed(page_key: str) -> discord.Embed:
 
     e.add_field(
         name="Commands",
-        value="\n".join(page["lines"]),
+        value=_HELP_COMMANDS_TEXT[page_key],
         inline=False,
     )
 
-    # Keep links out of the main text so it stays readable
-    links = []
-    if FAQ_URL:
-        links.append(f"FAQ: {FAQ_URL}")
-    if SUPPORT_SERVER_URL:
-        links.append(f"Support: {SUPPORT_SERVER_URL}")
-    if links:
-        e.set_footer(text=" • ".join(links))
+    if _HELP_FOOTER:
+        e.set_footer(text=_HELP_FOOTER)
 
     return e
 
@@ -2657,12 +3015,15 @@ def normalize_theme_key(raw: Optional[str]) -> str:
     t = re.sub(r"[^a-z0-9_\-]", "", t)
     return THEME_ALIASES.get(t, t)
 
+@lru_cache(maxsize=1024)
+def _stable_hash(seed: str) -> int:
+    return int(hashlib.blake2b(seed.encode("utf-8"), digest_size=8).hexdigest(), 16)
+
+
 def _stable_pick(pool: List[str], seed: str) -> str:
     if not pool:
         return ""
-    h = hashlib.blake2b(seed.encode("utf-8"), digest_size=8).hexdigest()
-    idx = int(h, 16) % len(pool)
-    return pool[idx]
+    return pool[_stable_hash(seed) % len(pool)]
 
 def get_theme_profile(guild_state: dict) -> Tuple[str, Dict[str, Any]]:
     theme_id = normalize_theme_key(guild_state.get("theme"))
@@ -2897,13 +3258,42 @@ def get_theme_layout(guild_state: dict, theme_id: Optional[str] = None) -> dict:
 
 def format_event_dt(dt: datetime) -> str:
     # Example: January 5, 2026 • 8:30 PM CST
-    date_part = dt.strftime("%B %d, %Y")
-    time_part = dt.strftime("%I:%M %p").lstrip("0")  # removes leading 0
-    tz_part = dt.strftime("%Z")
+    date_part = format_long_date(dt)
+    time_part = f"{dt.hour % 12 or 12}:{dt.minute:02d} {'AM' if dt.hour < 12 else 'PM'}"
+    tz_part = dt.tzname() or ""
     if tz_part:
         return f"{date_part} • {time_part} {tz_part}"
     return f"{date_part} • {time_part}"
 
+@lru_cache(maxsize=4096)
+def event_local_dt(ts, tz) -> datetime:
+    """Event timestamp as an aware datetime in `tz`. Memoized: the same events are
+    converted for every channel on every tick, and (ts, tz) fully determines it."""
+    return datetime.fromtimestamp(float(ts), tz=tz)
+
+
+@lru_cache(maxsize=4096)
+def event_when_str(ts, tz) -> str:
+    """The pinned board's "When:" line for an event (memoized like event_local_dt)."""
+    return event_local_dt(ts, tz).strftime("%A, %d %B %Y at %H:%M %Z")
+
+
+@lru_cache(maxsize=4096)
+def event_short_str(ts, tz) -> str:
+    """Compact 'MM/DD/YYYY HH:MM' for autocomplete labels and event pickers (memoized
+    like event_local_dt; autocomplete rebuilds these on every keystroke)."""
+    return event_local_dt(ts, tz).strftime("%m/%d/%Y %H:%M")
+
+
+def event_view(ev: dict, tz, now_ts: float) -> Tuple[datetime, str, int, bool]:
+    """(local datetime, time-left text, days, is_past) for one event, from a single
+    clock reading shared by the caller's whole loop. The datetime comes from the
+    memoized event_local_dt; only the time-left text is per-call work."""
+    ts = ev["timestamp"]
+    desc, days, passed = describe_time_left(int(ts - now_ts))
+    return event_local_dt(ts, tz), desc, days, passed
+
+
 def compute_dhm(target: datetime, now: datetime) -> tuple[int, int, int, bool]:
     delta_seconds = int((target - now).total_seconds())
     passed = delta_seconds <= 0
@@ -2931,22 +3321,14 @@ def build_embed_for_channel(channel_state: dict, guild_state: dict) -> discord.E
     layout = get_theme_layout(channel_state) or {}
 
     # Harden events
+    # Already in timestamp order (see sort_events), so "next upcoming" logic holds.
     events = channel_state.get("events", [])
     if not isinstance(events, list):
         events = []
-    events = list(events)  # shallow copy of list
 
     tz = get_guild_timezone(channel_state)
 
-    now = datetime.now(tz)
-
-    # Sort by timestamp so "next upcoming" logic is true
-    def _ts(ev):
-        try:
-            return float(ev.get("timestamp", 0))
-        except Exception:
-            return 0.0
-    events.sort(key=_ts)
+    now_ts = time.time()
 
     override_title = (channel_state.get("countdown_title_override") or "").strip()
     embed_title = override_title[:256] if override_title else (layout.get("title") or "Event Countdown")[:256]
@@ -2978,14 +3360,12 @@ def build_embed_for_channel(channel_state: dict, guild_state: dict) -> discord.E
     blocks = []
     banner_url = None
 
-    for ev in events:
-        try:
-            dt = datetime.fromtimestamp(float(ev["timestamp"]), tz=tz)
-        except Exception:
-            continue
+    # Past events are a prefix of the sorted list; skip them without touching a datetime.
+    first_upcoming = bisect_events(events, now_ts)
 
-        delta = dt - now
-        if delta.total_seconds() < 0:
+    for ev in events[first_upcoming:]:
+        ts = ev.get("timestamp")
+        if not isinstance(ts, (int, float)) or ts < now_ts:
             continue
 
         # capture banner for the *next upcoming* event that has one
@@ -2994,21 +3374,15 @@ def build_embed_for_channel(channel_state: dict, guild_state: dict) -> discord.E
             if isinstance(u, str) and u.strip():
                 banner_url = u.strip()
 
-        days = delta.days
-        hours = (delta.seconds // 3600)
-        minutes = (delta.seconds % 3600) // 60
-
         name = str(ev.get("name", "Untitled Event"))[:256]  # avoid absurdly long names
-        
-        # Use dynamic Discord timestamps (from spec) - client-side updates!
-        unix_ts = int(dt.timestamp())
 
-        when_str = dt.strftime("%A, %d %B %Y at %H:%M %Z")
+        when_str = event_when_str(ts, tz)
 
         if time_unit == "discord":
-            countdown_str = f"<t:{unix_ts}:R>"
+            # Use dynamic Discord timestamps (from spec) - client-side updates!
+            countdown_str = f"<t:{int(ts)}:R>"
         else:
-            countdown_str = format_time_unit(int(delta.total_seconds()), time_unit)
+            countdown_str = format_time_unit(int(ts - now_ts), time_unit)
 
         lines = [
             f"{emoji} **{name}**",
@@ -3060,24 +3434,70 @@ def build_embed_for_channel(channel_state: dict, guild_state: dict) -> discord.E
 
 
 
+# channel_id -> (pinned message id, render key) of the last successful tick edit.
+# With the default "discord" time unit the countdown text is rendered client-side,
+# so the embed only changes when settings/events change or an event goes past.
+_board_render_cache: Dict[int, Tuple[int, tuple]] = {}
+
+
+# channel_id -> epoch of the last tick that fetched/verified the pinned message.
+# While a board's render key is unchanged the tick only re-verifies the pin
+# (still there, still pinned) every PIN_RECHECK_SECONDS.
+_pin_checked_at: Dict[int, float] = {}
+PIN_RECHECK_SECONDS = 15 * 60
+PIN_RECHECK_IDLE_SECONDS = 60 * 60  # nothing due within 24h
+
+# channel_id -> (pinned message id, embed_signature) of the last embed we sent.
+_board_embed_sigs: Dict[int, Tuple[int, int]] = {}
+
+
+def embed_signature(embed: discord.Embed) -> int:
+    """In-process fingerprint of an embed's rendered payload."""
+    payload = embed.to_dict()
+    if orjson is not None:
+        return hash(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS))
+    return hash(json.dumps(payload, sort_keys=True))
+
+
+def countdown_render_key(channel_state: dict, now_ts: float) -> tuple:
+    """Everything build_embed_for_channel's output depends on, as a hashable key."""
+    events = channel_state.get("events", [])
+    if not isinstance(events, list):
+        events = []
+    ev_key = tuple(
+        (ev.get("timestamp"), ev.get("name"), ev.get("banner_url"),
+         ev.get("owner_user_id"), ev.get("owner_name"))
+        for ev in events if isinstance(ev, dict)
+    )
+    time_unit = channel_state.get("time_unit", "discord")
+    if time_unit == "discord":
+        # Only which events are still upcoming matters, not the exact minute. Events
+        # are kept in timestamp order, so that's the length of the past prefix.
+        clock = count_events_before(events, now_ts)
+    else:
+        clock = int(now_ts)
+    ct = channel_state.get("custom_theme")
+    ct_key = tuple(sorted(ct.items())) if isinstance(ct, dict) else None
+    return (
+        ev_key, clock, time_unit,
+        channel_state.get("theme"), ct_key, channel_state.get("timezone"),
+        channel_state.get("countdown_title_override"),
+        channel_state.get("countdown_description_override"),
+    )
+
+
 def build_streak_embed_for_channel(channel_state: dict, guild_state: dict) -> discord.Embed:
     """Render the pinned STREAK board for one channel — count-UP "days since" trophies,
     longest streak first. Mirrors build_embed_for_channel's structure/theming but counts
     UP from each streak's start date and never filters anything out (streaks don't end)."""
     layout = get_theme_layout(channel_state) or {}
 
-    streaks = [ev for ev in channel_state.get("events", []) if is_streak_event(ev)]
+    # Longest-running streak first (oldest start date = biggest number = top of the
+    # trophy case) — same order as the reset/remove pickers.
+    streaks = _ordered_streaks(channel_state)
     tz = get_guild_timezone(channel_state)
     now = datetime.now(tz)
 
-    # Longest-running streak first (oldest start date = biggest number = top of the trophy case).
-    def _ts(ev):
-        try:
-            return float(ev.get("timestamp", 0))
-        except Exception:
-            return 0.0
-    streaks.sort(key=_ts)
-
     override_title = (channel_state.get("countdown_title_override") or "").strip()
     embed_title = override_title[:256] if override_title else "🔥 Streak Tracker"
 
@@ -3109,7 +3529,7 @@ def build_streak_embed_for_channel(channel_state: dict, guild_state: dict) -> di
 
         days = max(0, (now.date() - start.date()).days)
         name = str(ev.get("name", "Untitled Streak"))[:256]
-        since_str = start.strftime("%B %d, %Y")
+        since_str = format_long_date(start)
         day_word = "day" if days == 1 else "days"
         blocks.append(
             f"{emoji} **{name}**\n**{days} {day_word}** — going strong since {since_str}"
@@ -3144,12 +3564,32 @@ def build_board_embed(channel_state: dict, guild_state: dict) -> discord.Embed:
 
 
 async def rebuild_pinned_message_for_channel(
-    channel: discord.TextChannel, channel_state: dict, guild_state: dict
+    channel: discord.TextChannel, channel_state: dict, guild_state: dict,
+    *, skip_if_unchanged: bool = False,
 ):
-    """Rebuild the pinned countdown for ONE channel bucket (unpin old, send + pin new)."""
-    sort_events(channel_state)
+    """Rebuild the pinned countdown for ONE channel bucket (unpin old, send + pin new).
 
+    With skip_if_unchanged, a board whose embed is identical to the one last posted
+    (an edit to an event beyond the shown entries, a no-op change) is left alone as
+    long as the message still exists; if someone unpinned it, it is re-pinned in place."""
     old_id = channel_state.get("pinned_message_id")
+    embed = build_board_embed(channel_state, guild_state)
+    sig = embed_signature(embed)
+    if skip_if_unchanged and old_id and _board_embed_sigs.get(channel.id) == (int(old_id), sig):
+        try:
+            msg = await channel.fetch_message(int(old_id))
+        except (discord.NotFound, discord.Forbidden, discord.HTTPException):
+            pass  # gone or unreadable → fall through to a full rebuild
+        else:
+            if not msg.pinned:
+                try:
+                    bot_member = await get_bot_member(channel.guild)
+                    perms = channel.permissions_for(bot_member) if bot_member else None
+                    await ensure_countdown_pinned(channel.guild, channel, msg, perms=perms)
+                except Exception:
+                    pass  # same as below: never let the pin step crash the rebuild
+            return msg
+
     if old_id:
         try:
             old_msg = await channel.fetch_message(int(old_id))
@@ -3161,8 +3601,6 @@ async def rebuild_pinned_message_for_channel(
         except (discord.NotFound, discord.HTTPException, discord.Forbidden):
             pass
 
-    embed = build_board_embed(channel_state, guild_state)
-
     try:
         msg = await channel.send(embed=embed)
     except discord.Forbidden:
@@ -3188,10 +3626,79 @@ async def rebuild_pinned_message_for_channel(
         pass
 
     channel_state["pinned_message_id"] = msg.id
+    _board_embed_sigs[channel.id] = (msg.id, sig)
     save_state()
     return msg
 
 
+# Command-driven rebuilds are coalesced per channel: a burst of admin edits becomes
+# one unpin/send/pin round-trip, and the command replies without waiting on it.
+PINNED_REBUILD_DEBOUNCE_SECONDS = 1.0
+_pending_rebuilds: Dict[int, asyncio.TimerHandle] = {}
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def spawn_background(coro) -> asyncio.Task:
+    """Run `coro` without awaiting it, keeping a strong reference until it finishes
+    (the loop only holds weak ones, so an unreferenced task can be collected mid-run)."""
+    task = asyncio.get_running_loop().create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_task_done)
+    return task
+
+
+def _background_task_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        exc = task.exception()
+        print(f"[BG] {task.get_coro().__qualname__} failed: {type(exc).__name__}: {exc}")
+
+
+def schedule_pinned_rebuild(channel: discord.TextChannel, channel_state: dict, guild_state: dict) -> None:
+    """Queue rebuild_pinned_message_for_channel for `channel`, restarting the debounce
+    window if one is already pending."""
+    pending = _pending_rebuilds.pop(channel.id, None)
+    if pending is not None:
+        pending.cancel()
+
+    def _fire():
+        _pending_rebuilds.pop(channel.id, None)
+        spawn_background(rebuild_pinned_message_for_channel(
+            channel, channel_state, guild_state, skip_if_unchanged=True
+        ))
+
+    _pending_rebuilds[channel.id] = asyncio.get_running_loop().call_later(
+        PINNED_REBUILD_DEBOUNCE_SECONDS, _fire
+    )
+
+
+def schedule_pinned_rebuild_for_id(channel_id, channel_state: dict, guild_state: dict) -> None:
+    """schedule_pinned_rebuild by channel id. A cache miss (which means a REST fetch)
+    is resolved in the background, so the calling command can reply first."""
+    channel = cached_text_channel(int(channel_id))
+    if channel is not None:
+        schedule_pinned_rebuild(channel, channel_state, guild_state)
+        return
+
+    async def _resolve_then_schedule():
+        ch = await get_text_channel(channel_id)
+        if ch is not None:
+            schedule_pinned_rebuild(ch, channel_state, guild_state)
+
+    spawn_background(_resolve_then_schedule())
+
+
+def forget_channel_caches(channel_id: int) -> None:
+    """Forget every in-memory memo kept for one channel's board."""
+    _board_embed_sigs.pop(channel_id, None)
+    _board_render_cache.pop(channel_id, None)
+    _pin_checked_at.pop(channel_id, None)
+    _text_channels.pop(channel_id, None)
+    pending = _pending_rebuilds.pop(channel_id, None)
+    if pending is not None:
+        pending.cancel()
+
+
 
 async def get_or_create_pinned_message_for_channel(
     channel: discord.TextChannel,
@@ -3202,7 +3709,6 @@ async def get_or_create_pinned_message_for_channel(
 ):
     """Per-channel pinned-message resolver. `state_bucket` holds this channel's
     events + pinned_message_id; `guild_state` is used for the embed status line."""
-    sort_events(state_bucket)
     pinned_id = state_bucket.get("pinned_message_id")
 
     bot_member = await get_bot_member(channel.guild)
@@ -3344,20 +3850,55 @@ async def get_or_create_pinned_message_for_channel(
 
 
 
+# Channels the gateway cache didn't have and a REST fetch couldn't resolve either
+# (deleted / no access). Without this every update cycle re-fetches each dead channel.
+# Transient failures (5xx, rate limits, network) aren't recorded, so they retry next time.
+_channel_miss_at: Dict[int, float] = {}
+CHANNEL_MISS_RETRY_SECONDS = 10 * 60
+
+# bot.get_channel walks every guild until it finds the id, and the update loop asks
+# for every countdown channel each tick. Remember hits by id; discord.py updates the
+# cached TextChannel in place, and deletes/leaves drop entries (see the event handlers).
+_text_channels: Dict[int, discord.TextChannel] = {}
+
+
+def cached_text_channel(cid: int) -> Optional[discord.TextChannel]:
+    """Gateway-cached TextChannel for `cid` (no REST), or None."""
+    ch = _text_channels.get(cid)
+    # A full re-identify rebuilds guild objects; don't hand out one from the old cache.
+    if ch is not None and bot.get_guild(ch.guild.id) is ch.guild:
+        return ch
+    ch = bot.get_channel(cid)
+    if isinstance(ch, discord.TextChannel):
+        _text_channels[cid] = ch
+        return ch
+    _text_channels.pop(cid, None)
+    return None
+
+
 async def get_text_channel(channel_id) -> Optional[discord.TextChannel]:
     try:
         cid = int(channel_id)
     except (TypeError, ValueError):
         return None
 
-    ch = bot.get_channel(cid)
-    if isinstance(ch, discord.TextChannel):
+    ch = cached_text_channel(cid)
+    if ch is not None:
         return ch
+    missed = _channel_miss_at.get(cid)
+    if missed is not None and time.monotonic() - missed < CHANNEL_MISS_RETRY_SECONDS:
+        return None
     try:
         ch = await bot.fetch_channel(cid)
-        return ch if isinstance(ch, discord.TextChannel) else None
+    except (discord.NotFound, discord.Forbidden):
+        ch = None  # gone or hidden from us: worth remembering
     except Exception:
-        return None
+        return None  # 5xx / 429 / network blip: try again next time
+    if isinstance(ch, discord.TextChannel):
+        _channel_miss_at.pop(cid, None)
+        return ch
+    _channel_miss_at[cid] = time.monotonic()
+    return None
 
         
 def format_created_by_inline(ev: dict) -> str:
@@ -3434,10 +3975,11 @@ async def dm_owner_if_set(guild: discord.Guild, ev: dict, message: str):
         pass
 
 
-def get_event_by_index(guild_state: dict, index: int) -> Optional[dict]:
-    sort_events(guild_state)
-    events = guild_state.get("events", [])
-    if index < 1 or index > len(events):
+def get_event_by_index(channel_state: dict, index: int) -> Optional[dict]:
+    """The event at 1-based `index` in a channel bucket, or None if out of range. The
+    shared bounds check for every index-taking command (remindall, template save, …)."""
+    events = channel_state["events"]  # always present once apply_channel_defaults has run
+    if not 1 <= index <= len(events):
         return None
     return events[index - 1]
 
@@ -3470,7 +4012,12 @@ async def refresh_countdown_message_for_channel(
         return
 
     try:
-        await pinned.edit(embed=build_board_embed(channel_state, guild_state))
+        embed = build_board_embed(channel_state, guild_state)
+        sig = (pinned.id, embed_signature(embed))
+        if _board_embed_sigs.get(channel.id) == sig:
+            return  # e.g. a settings modal resubmitted unchanged
+        await pinned.edit(embed=embed)
+        _board_embed_sigs[channel.id] = sig
     except discord.NotFound:
         if channel_state.get("pinned_message_id") == pinned.id:
             channel_state["pinned_message_id"] = None
@@ -3491,6 +4038,13 @@ async def refresh_countdown_message_for_channel(
 # ==========================
 # AUTOCOMPLETE HELPERS
 # ==========================
+@lru_cache(maxsize=4096)
+def _casefold_name(name: str) -> str:
+    """Lower-cased event name for autocomplete matching. Autocomplete fires on every
+    keystroke over the same few names, so memoizing skips re-lowering them each time."""
+    return name.lower()
+
+
 async def event_index_autocomplete(
     interaction: discord.Interaction,
     current: str,
@@ -3505,39 +4059,30 @@ async def event_index_autocomplete(
     if cs is None:
         return []
     tz = get_guild_timezone(cs)
-    sort_events(cs)
 
-    now = datetime.now(tz)
     cur = (current or "").strip().lower()
-    grace = timedelta(seconds=EVENT_START_GRACE_SECONDS)
+    events = cs.get("events", [])
+
+    # Hide events that are effectively "past" (including grace window) — a sorted prefix.
+    start = bisect_events(events, time.time() - EVENT_START_GRACE_SECONDS, right=True)
 
     choices: List[app_commands.Choice[int]] = []
 
-    for idx, ev in enumerate(cs.get("events", []), start=1):
+    for idx, ev in enumerate(events[start:], start=start + 1):
         ts = ev.get("timestamp")
         if not isinstance(ts, (int, float)):
             continue
 
-        try:
-            dt = datetime.fromtimestamp(ts, tz=tz)
-        except Exception:
-            continue
-
-        # Hide events that are effectively "past" (including grace window)
-        if dt + grace <= now:
-            continue
-
         name = ev.get("name") or "Event"
-        label = f"{idx}. {name} — {dt.strftime('%m/%d/%Y %H:%M')}"
-        label_l = label.lower()
-        name_l = name.lower()
+        label = f"{idx}. {name} — {event_short_str(ts, tz)}"
 
         if cur:
+            name_l = _casefold_name(name)
             if cur.isdigit():
                 if not str(idx).startswith(cur) and cur not in name_l:
                     continue
             else:
-                if cur not in name_l and cur not in label_l:
+                if cur not in name_l and cur not in label.lower():
                     continue
 
         choices.append(app_commands.Choice(name=label[:100], value=idx))
@@ -3551,11 +4096,17 @@ async def event_index_autocomplete(
 # ==========================
 @tasks.loop(minutes=15)
 async def weekly_digest_loop():
-    for gid_str, guild_state in list(state.get("guilds", {}).items()):
+    now_ts = time.time()
+    guilds = state.get("guilds", {})
+    # Snapshot only the keys (a guild can join/leave while we await a send below).
+    for gid_str in tuple(guilds):
+        guild_state = guilds.get(gid_str)
+        if guild_state is None:
+            continue
         for cid, channel_state in iter_channel_states(guild_state):
             try:
                 tz = get_guild_timezone(channel_state)
-                now = datetime.now(tz)
+                now = datetime.fromtimestamp(now_ts, tz)
 
                 # Send once each Monday any time after 9:00 AM local (per-channel timezone).
                 if now.weekday() != 0:  # Monday = 0
@@ -3579,14 +4130,17 @@ async def weekly_digest_loop():
                 if channel is None:
                     continue
 
-                sort_events(channel_state)
-
+                # The next-7-days window is a contiguous run of the sorted event list.
+                events = channel_state.get("events", [])
+                lo = bisect_events(events, now_ts, right=True, fallback=None)
+                hi = bisect_events(events, cutoff_ts, right=True, fallback=None)
+                if lo is None or hi is None:
+                    lo, hi = 0, len(events)
                 upcoming = []
-                for ev in channel_state.get("events", []):
+                for ev in events[lo:hi]:
                     ts = ev.get("timestamp")
                     if isinstance(ts, int) and now_ts < ts <= cutoff_ts:
-                        dt = datetime.fromtimestamp(ts, tz=tz)
-                        desc, _, _ = compute_time_left(now, dt)
+                        dt, desc, _, _ = event_view(ev, tz, now_ts)
                         upcoming.append(
                             f"• **{ev.get('name', 'Event')}** — {dt.strftime('%m/%d %I:%M %p')} ({desc})"
                         )
@@ -3615,8 +4169,6 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
     # used only for the server-level Supporter/Pro status line in the embed.
     if True:
         if True:
-            sort_events(guild_state)
-
             # ----------------------------
             # ✅ Dirty flag + flush helpers
             # ----------------------------
@@ -3625,6 +4177,10 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
             def mark_dirty():
                 nonlocal state_changed
                 state_changed = True
+                # Also flag the background flusher, so a send is still persisted
+                # if something later in this cycle raises before the final flush.
+                if flush_state.is_running():
+                    mark_state_dirty()
 
             def flush_if_dirty():
                 nonlocal state_changed
@@ -3633,9 +4189,12 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
                     state_changed = False
 
             # ---- EVENT CHECKS (start blast + milestones + repeats) ----
+            # One clock read per cycle; everything below derives from it.
             tz = get_guild_timezone(guild_state)
-            today = datetime.now(tz).date()
-            now = datetime.now(tz)
+            now_ts = int(time.time())
+            now = datetime.fromtimestamp(now_ts, tz)
+            today = now.date()
+            today_iso = today.isoformat()
             now_dt = now
             for ev in list(guild_state.get("events", [])):
                 if ev.get("silenced", False):
@@ -3646,7 +4205,7 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
                     continue
 
                 try:
-                    dt = datetime.fromtimestamp(ts, tz=tz)
+                    dt = event_local_dt(ts, tz)
                 except Exception:
                     continue
                 # ----------------------------
@@ -3663,10 +4222,10 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
                 # (skip if server has auto-delete disabled — Supporter perk)
                 msgs = ev.get("reminder_messages", []) or []
                 if msgs and guild_state.get("auto_delete_milestones", True):
-                    current_time = time.time()
+                    current_time = now_ts
                     remaining_msgs = []
                     had_forbidden = False
-                    state_changed = False
+                    msgs_changed = False
 
                     for item in msgs:
                         try:
@@ -3701,15 +4260,15 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
 
                         ch = await get_text_channel(ch_id)
                         if ch is None:
-                            state_changed = True
+                            msgs_changed = True
                             continue
 
                         try:
                             await ch.get_partial_message(msg_id).delete()
-                            state_changed = True
+                            msgs_changed = True
                         except discord.Forbidden:
                             had_forbidden = True
-                            state_changed = True
+                            msgs_changed = True
                             # Notify once then stop trying
                             try:
                                 missing = missing_channel_perms(ch, ch.guild)
@@ -3722,19 +4281,18 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
                             except Exception:
                                 pass
                         except (discord.NotFound, discord.HTTPException):
-                            state_changed = True
+                            msgs_changed = True
                             pass  # already gone or transient
 
                     # Update the list to only keep messages we didn't delete
-                    if state_changed or len(remaining_msgs) != len(msgs):
+                    if msgs_changed or len(remaining_msgs) != len(msgs):
                         ev["reminder_messages"] = remaining_msgs
                         mark_dirty()
-                        flush_if_dirty()
                         
                 # ---- EVENT START BLAST (time-of-event) ----
-                if dt <= now:
+                if ts <= now_ts:
                     if not bool(ev.get("start_announced", False)):
-                        age = (now - dt).total_seconds()
+                        age = now_ts - ts
                         if age <= EVENT_START_GRACE_SECONDS:
                             mention_prefix = ""
                             allowed = discord.AllowedMentions.none()
@@ -3761,7 +4319,6 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
                                 # ✅ stop re-sending every loop
                                 ev["start_announced"] = True
                                 mark_dirty()
-                                flush_if_dirty()
 
                             except discord.Forbidden:
                                 missing = missing_channel_perms(channel, channel.guild)
@@ -3777,17 +4334,21 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
                     continue  # don’t do milestones/repeats for started/past events
 
                 # ---- Milestones + repeating reminders ----
-                desc, _, passed = compute_time_left(now, dt)
-                if passed:
+                # Plain int compare; an event still in the future can't be on an
+                # earlier calendar day, so days_left below is never negative.
+                secs_left = int(ts) - now_ts
+                if secs_left <= 0:
                     continue
+                desc = describe_time_left(secs_left)[0]
 
                 days_left = calendar_days_left(dt, now=now)
-                if days_left < 0:
-                    continue
 
+                # A milestone and a repeat reminder never both post for one event on
+                # the same tick: a milestone that fires suppresses the repeat, so each
+                # event costs at most one channel.send per cycle.
                 milestone_sent_today = False
 
-                milestones = ev.get("milestones", DEFAULT_MILESTONES)
+                milestones = event_milestones(ev)
                 announced = ev.get("announced_milestones", [])
                 if not isinstance(announced, list):
                     announced = []
@@ -3799,7 +4360,7 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
 
                     event_name = ev.get("name", "Event")
                     try:
-                        date_str = dt.strftime("%B %d, %Y")
+                        date_str = format_long_date(dt)
                     except Exception:
                         date_str = ""
                     body = build_milestone_message(
@@ -3825,9 +4386,6 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
                         milestone_sent_today = True
                         mark_dirty()
 
-                        # ✅ optional: flush immediately after a public send
-                        flush_if_dirty()
-
                     except discord.Forbidden:
                         missing = missing_channel_perms(channel, channel.guild)
                         await notify_owner_missing_perms(
@@ -3838,19 +4396,21 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
                         )
                         continue
 
-                    try:
-                        await dm_owner_if_set(
+                    # Owner DM goes out in the background (its own user fetch + DM
+                    # round trips) so it doesn't hold up the rest of this board's cycle.
+                    if ev.get("dm_opt_in"):
+                        spawn_background(dm_owner_if_set(
                             channel.guild,
                             ev,
-                            f"⏰ Milestone: **{ev.get('name', 'Event')}** is in **{days_left} day{'s' if days_left != 1 else ''}** "
-                            f"(on {dt.strftime('%B %d, %Y at %I:%M %p %Z')})."
-                        )
-                    except Exception:
-                        pass
+                            _MILESTONE_DM_TEMPLATE.format(
+                                name=ev.get("name", "Event"), days=days_left,
+                                unit=_plural(days_left, "day"), when=format_long_datetime(dt),
+                            )
+                        ))
 
                 repeat_every = ev.get("repeat_every_days")
                 if isinstance(repeat_every, int) and repeat_every > 0:
-                    anchor_str = ev.get("repeat_anchor_date") or today.isoformat()
+                    anchor_str = ev.get("repeat_anchor_date") or today_iso
                     try:
                         anchor = date.fromisoformat(anchor_str)
                     except ValueError:
@@ -3866,9 +4426,9 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
                             ev["announced_repeat_dates"] = sent_dates
                             mark_dirty()
 
-                        if today.isoformat() not in sent_dates and not milestone_sent_today and should_send_reminder_based_on_time(ev, now, dt):
+                        if not milestone_sent_today and today_iso not in sent_dates and should_send_reminder_based_on_time(ev, now, dt):
                             try:
-                                date_str = dt.strftime("%B %d, %Y")
+                                date_str = format_long_date(dt)
                                 text = build_repeat_message(
                                     guild_state,
                                     event_name=ev.get("name", "Event"),
@@ -3886,13 +4446,10 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
                                 )
 
                                 # mutate state
-                                sent_dates.append(today.isoformat())
+                                sent_dates.append(today_iso)
                                 ev["announced_repeat_dates"] = sent_dates[-180:]
                                 mark_dirty()
 
-                                # ✅ optional: flush immediately after a public send
-                                flush_if_dirty()
-
                             except discord.Forbidden:
                                 missing = missing_channel_perms(channel, channel.guild)
                                 await notify_owner_missing_perms(
@@ -3904,31 +4461,56 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
                             except discord.HTTPException as e:
                                 print(f"[Guild {guild_id}] Failed to send repeat reminder: {e}")
 
-                            try:
-                                await dm_owner_if_set(
+                            if ev.get("dm_opt_in"):
+                                spawn_background(dm_owner_if_set(
                                     channel.guild,
                                     ev,
-                                    f"🔁 Repeat reminder: **{ev.get('name', 'Event')}** is in **{desc}** "
-                                    f"(on {dt.strftime('%B %d, %Y at %I:%M %p %Z')})."
-                                )
-                            except Exception:
-                                pass
+                                    _REPEAT_DM_TEMPLATE.format(
+                                        name=ev.get("name", "Event"), time_left=desc,
+                                        when=format_long_datetime(dt),
+                                    )
+                                ))
 
             # ---- Prune after processing (so start blast can happen) ----
             removed = prune_past_events(
                 guild_state,
-                now=datetime.now(get_guild_timezone(guild_state)) - timedelta(seconds=MILESTONE_CLEANUP_AFTER_EVENT_SECONDS),
+                now=now - timedelta(seconds=MILESTONE_CLEANUP_AFTER_EVENT_SECONDS),
             )
             if removed:
                 mark_dirty()
                 # (No immediate flush needed; no public post happened.)
 
             # ---- Update pinned embed once at end (reflects changes) ----
+            # Nothing to show and the pin was checked recently → skip the pin work
+            # (a fetch_message + pin check per channel) until something is due.
+            render_key = countdown_render_key(guild_state, now_ts)
             try:
-                pinned = await get_or_create_pinned_message_for_channel(channel, guild_state, server_state, allow_create=True)
-            except Exception:
-                print(f"[Guild {guild_id}] get_or_create_pinned_message failed:\n{traceback.format_exc()}")
-                pinned = None
+                saved_pin = int(guild_state.get("pinned_message_id") or 0)
+            except (TypeError, ValueError):
+                saved_pin = 0
+            # Boards whose next event is over a day out are re-verified less often.
+            next_ev = first_event_after(guild_state.get("events", []), now_ts, inclusive=True)
+            recheck = PIN_RECHECK_SECONDS
+            if next_ev is None or next_ev["timestamp"] - now_ts > SECONDS_PER_DAY:
+                recheck = PIN_RECHECK_IDLE_SECONDS
+            pin_idle = (
+                saved_pin
+                and _board_render_cache.get(channel.id) == (saved_pin, render_key)
+                and now_ts - _pin_checked_at.get(channel.id, 0) < recheck
+            )
+
+            pinned = None
+            if not pin_idle:
+                try:
+                    pinned = await get_or_create_pinned_message_for_channel(channel, guild_state, server_state, allow_create=True)
+                except Exception:
+                    print(f"[Guild {guild_id}] get_or_create_pinned_message failed:\n{traceback.format_exc()}")
+                    pinned = None
+                if pinned is not None:
+                    _pin_checked_at[channel.id] = now_ts
+
+            if pinned is not None and _board_render_cache.get(channel.id) == (pinned.id, render_key):
+                pinned = None  # nothing visible changed since the last tick's edit
 
             if pinned is not None:
                 try:
@@ -3937,14 +4519,21 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
                     print(f"[Guild {guild_id}] build_embed_for_channel failed:\n{traceback.format_exc()}")
                     embed = None
 
+                if embed is not None:
+                    sig = (pinned.id, embed_signature(embed))
+                    if _board_embed_sigs.get(channel.id) == sig:
+                        # e.g. a "days" countdown reads the same for hours at a time
+                        _board_render_cache[channel.id] = (pinned.id, render_key)
+                        embed = None
                 if embed is not None:
                     try:
                         await pinned.edit(embed=embed)
+                        _board_render_cache[channel.id] = (pinned.id, render_key)
+                        _board_embed_sigs[channel.id] = sig
                     except discord.NotFound:
                         if guild_state.get("pinned_message_id") == pinned.id:
                             guild_state["pinned_message_id"] = None
                             mark_dirty()
-                            flush_if_dirty()  # worth flushing quickly
                     except discord.Forbidden:
                         missing = missing_channel_perms(channel, channel.guild)
                         await notify_owner_missing_perms(
@@ -3956,7 +4545,8 @@ async def _run_countdown_cycle(guild_id, guild_state, channel, bot_member, serve
                     except discord.HTTPException as e:
                         print(f"[Guild {guild_id}] Failed to edit pinned message: {e}")
 
-            # ✅ Final flush: saves prune/anchor fixes/etc once per channel cycle
+            # ✅ Single flush per channel cycle: sends, prune, anchor fixes, etc.
+            # are all batched into one save_state() call.
             flush_if_dirty()
 
 
@@ -4305,9 +4895,14 @@ async def _run_streak_cycle(guild_id, channel_state, channel, bot_member, server
         except Exception:
             print(f"[Guild {guild_id}] build_board_embed (streak) failed:\n{traceback.format_exc()}")
             embed = None
+        # Streak counts change once a day, so most ticks would re-send the same board.
+        sig = (pinned.id, embed_signature(embed)) if embed is not None else None
+        if sig is not None and _board_embed_sigs.get(channel.id) == sig:
+            embed = None
         if embed is not None:
             try:
                 await pinned.edit(embed=embed)
+                _board_embed_sigs[channel.id] = sig
             except discord.NotFound:
                 if channel_state.get("pinned_message_id") == pinned.id:
                     channel_state["pinned_message_id"] = None
@@ -4327,32 +4922,49 @@ async def update_countdowns():
     """Per-channel countdown engine: for each guild, refresh every countdown
     channel's milestones, start blasts, repeats, pruning, and pinned embed."""
     guilds = state.get("guilds", {})
-    for gid_str, guild_state in list(guilds.items()):
+    # Guilds run concurrently so one server's Discord round trips don't delay the
+    # rest; channels within a guild stay sequential. The semaphore caps how many
+    # guilds are in flight so a big shard doesn't burst the REST rate limits.
+    sem = asyncio.Semaphore(UPDATE_GUILD_CONCURRENCY)
+
+    async def _update_guild(gid_str, guild_state):
         try:
             guild_id_int = int(gid_str)
         except (TypeError, ValueError):
-            continue
-        for cid, channel_state in iter_channel_states(guild_state):
-            try:
-                channel = await get_text_channel(cid)
-                if channel is None:
-                    continue
-                bot_member = await get_bot_member(channel.guild)
-                if bot_member is None:
+            return
+        async with sem:
+            for cid, channel_state in iter_channel_states(guild_state):
+                try:
+                    channel = await get_text_channel(cid)
+                    if channel is None:
+                        continue
+                    bot_member = await get_bot_member(channel.guild)
+                    if bot_member is None:
+                        continue
+                    # Streak channels count UP and run their own cycle; countdown
+                    # channels use the classic engine.
+                    if is_streak_channel(channel_state):
+                        await _run_streak_cycle(
+                            guild_id_int, channel_state, channel, bot_member, guild_state
+                        )
+                    else:
+                        await _run_countdown_cycle(
+                            guild_id_int, channel_state, channel, bot_member, guild_state
+                        )
+                except Exception as e:
+                    print(f"[Guild {gid_str} / channel {cid}] update_countdowns crashed: {type(e).__name__}: {e}")
                     continue
-                # Streak channels count UP and run their own cycle; countdown
-                # channels use the classic engine.
-                if is_streak_channel(channel_state):
-                    await _run_streak_cycle(
-                        guild_id_int, channel_state, channel, bot_member, guild_state
-                    )
-                else:
-                    await _run_countdown_cycle(
-                        guild_id_int, channel_state, channel, bot_member, guild_state
-                    )
-            except Exception as e:
-                print(f"[Guild {gid_str} / channel {cid}] update_countdowns crashed: {type(e).__name__}: {e}")
-                continue
+
+    # Guilds with no channel buckets have nothing to do; don't spin up a task for them.
+    # (No await inside the comprehension, so the dict can't change under it — no copy needed.)
+    active = [(gid_str, g) for gid_str, g in guilds.items() if g.get("channels")]
+    results = await asyncio.gather(
+        *(_update_guild(gid_str, guild_state) for gid_str, guild_state in active),
+        return_exceptions=True,
+    )
+    for (gid_str, _), res in zip(active, results):
+        if isinstance(res, BaseException):
+            print(f"[Guild {gid_str}] update_countdowns crashed: {type(res).__name__}: {res}")
 
 
 @update_countdowns.before_loop
@@ -4390,12 +5002,15 @@ async def vote_cmd(interaction: discord.Interaction):
 @app_commands.checks.has_permissions(manage_guild=True)
 @app_commands.guild_only()
 async def vote_debug_cmd(interaction: discord.Interaction):
+    # The forced Top.gg call below is a network round trip; ack first.
+    await interaction.response.defer(ephemeral=True, thinking=True)
+
     # bypass cache so you see reality right now
     _vote_cache.pop(interaction.user.id, None)
     voted = await topgg_has_voted(interaction.user.id, force=True)
 
     cfg = "✅" if (TOPGG_TOKEN and TOPGG_BOT_ID) else "❌"
-    await interaction.response.send_message(
+    await interaction.followup.send(
         "🔎 **Top.gg Vote Debug**\n"
         f"Configured (token + bot id): {cfg}\n"
         f"Bot ID set to: `{TOPGG_BOT_ID or 'MISSING'}`\n"
@@ -4422,43 +5037,52 @@ async def on_app_command_error(interaction: discord.Interaction, error: app_comm
     # Anything else: log for you
     print(f"[APP_COMMAND_ERROR] {type(error).__name__}: {error}")
 
-def format_events_list(guild_state: dict) -> str:
-    sort_events(guild_state)
-    events = guild_state.get("events", [])
-    if not events:
-        return "There are no events set for this server yet.\nAdd one with `/addevent`."
+_EVENT_LIST_LINE = "**{idx}. {name}** — <t:{ts}:f> ({desc}) [{status}]{repeat}{silenced}{owner}"
 
-    lines = []
-    for idx, ev in enumerate(events, start=1):
-        ts = ev.get("timestamp")
-        if not isinstance(ts, (int, float)):
-            continue
 
-        tz = get_guild_timezone(guild_state)
-        dt = datetime.fromtimestamp(ts, tz=tz)
-        now = datetime.now(tz)
-        desc, _, passed = compute_time_left(now, dt)
-        status = "✅ done" if passed else "⏳ active"
+@lru_cache(maxsize=None)
+def _repeat_note(repeat_every) -> str:
+    """The list line's ' 🔁 every N days' suffix ('' when not repeating). Keyed by the
+    raw field value, so there's one entry per interval in use (1–365 at most)."""
+    if isinstance(repeat_every, int) and repeat_every > 0:
+        return f" 🔁 every {repeat_every} {_plural(repeat_every, 'day')}"
+    return ""
+
 
-        repeat_every = ev.get("repeat_every_days")
-        repeat_note = ""
-        if isinstance(repeat_every, int) and repeat_every > 0:
-            repeat_note = f" 🔁 every {repeat_every} day{'s' if repeat_every != 1 else ''}"
+def _event_list_line(idx: int, ev: dict, now_ts: int, passed: bool) -> str:
+    desc = describe_time_left(int(ev["timestamp"] - now_ts))[0]
 
-        silenced = ev.get("silenced", False)
-        silenced_note = " 🔕 silenced" if silenced and not passed else ""
+    ol = "" if passed else format_owner_inline(ev)
+    return _EVENT_LIST_LINE.format(
+        idx=idx,
+        name=ev.get("name", "Event"),
+        ts=int(ev["timestamp"]),
+        desc=desc,
+        status="✅ done" if passed else "⏳ active",
+        repeat=_repeat_note(ev.get("repeat_every_days")),
+        silenced=" 🔕 silenced" if ev.get("silenced", False) and not passed else "",
+        owner=f" • {ol}" if ol else "",
+    )
 
-        owner_note = ""
-        ol = "" if passed else format_owner_inline(ev)
-        if ol:
-            owner_note = f" • {ol}"
 
-        lines.append(
-            f"**{idx}. {ev.get('name', 'Event')}** — {dt.strftime('%m/%d/%Y %H:%M')} "
-            f"({desc}) [{status}]{repeat_note}{silenced_note}{owner_note}"
-        )
+def format_events_list(guild_state: dict) -> str:
+    events = guild_state.get("events", [])
+    if not events:
+        return "There are no events set for this server yet.\nAdd one with `/addevent`."
 
-    return "\n".join(lines)
+    now_ts = int(time.time())
+    # Events are in timestamp order, so the done/active split is one bisect: everything
+    # before `done` has int(ts - now) < 0, i.e. ts <= now - 1 (describe_time_left's "past").
+    done = bisect_events(events, now_ts - 1, right=True, fallback=None)  # None: decide per event
+    # A list (not a generator): str.join materializes a generator into a list first anyway.
+    return "\n".join([
+        _event_list_line(
+            idx, ev, now_ts,
+            idx <= done if done is not None else int(ev["timestamp"] - now_ts) < 0,
+        )
+        for idx, ev in enumerate(events, start=1)
+        if isinstance(ev.get("timestamp"), (int, float))
+    ])
 
 
 def _pro_channel_gate_embed() -> discord.Embed:
@@ -4512,7 +5136,6 @@ async def setup_countdown_channel(guild: discord.Guild, channel, actor):
     cs["event_channel_set_by"] = int(actor.id)
     cs["event_channel_set_at"] = int(time.time())
 
-    sort_events(cs)
     save_state()
 
     # Permissions check. Split into perms that BLOCK the countdown (it can't post)
@@ -4662,12 +5285,60 @@ async def setup_streak_channel(guild: discord.Guild, channel, actor):
 # commands — no duplicated business logic.
 
 def _actor_can_manage(interaction: discord.Interaction) -> bool:
-    """True if the interacting user has Manage Server or Administrator."""
-    member = interaction.user
-    if not isinstance(member, discord.Member) and interaction.guild is not None:
-        member = interaction.guild.get_member(interaction.user.id) or member
+    """True if the interacting user has Manage Server or Administrator. Reads the
+    permissions Discord resolves into the interaction payload, so there's no member
+    cache lookup (or fetch on a miss). Always False outside a guild."""
+    if interaction.guild_id is None:
+        return False
+    perms = interaction.permissions
+    return perms.manage_guild or perms.administrator
+
+
+async def resolve_manage_target(interaction: discord.Interaction, cmd: str, noun: str):
+    """Resolve the server a manage command acts on, for commands that also work by DM
+    (via /linkserver): returns (guild, guild_state, member, channel_id) — channel_id is
+    None from a DM — or replies with the reason and returns None. Expects a deferred
+    interaction."""
+    if interaction.guild is not None:
+        if not _actor_can_manage(interaction):
+            await interaction.edit_original_response(
+                content=f"You need the **Manage Server** or **Administrator** permission to add {noun} in this server."
+            )
+            return None
+        guild = interaction.guild
+        return guild, get_guild_state(guild.id), interaction.user, interaction.channel_id
+
+    user = interaction.user
+    linked_guild_id = get_user_links().get(user.id)
+    if not linked_guild_id:
+        await interaction.edit_original_response(
+            content=f"I don't know which server to use for your DMs yet.\nIn the server you want to control, run `/linkserver`, then DM me `{cmd}` again."
+        )
+        return None
+
+    guild = bot.get_guild(linked_guild_id)
+    if not guild:
+        await interaction.edit_original_response(
+            content="I can't find the linked server anymore. Maybe I was removed from it?\nRe-add me and run `/linkserver` again."
+        )
+        return None
+
+    # A DM carries no guild permissions, so this is the one path that needs the member.
+    member = guild.get_member(user.id)
+    if member is None:
+        try:
+            member = await guild.fetch_member(user.id)
+        except Exception:
+            member = None
+
     perms = getattr(member, "guild_permissions", None)
-    return bool(perms and (perms.manage_guild or perms.administrator))
+    if not perms or not (perms.manage_guild or perms.administrator):
+        await interaction.edit_original_response(
+            content=f"You no longer have **Manage Server** (or **Administrator**) in the linked server, so I can’t add {noun} via DM."
+        )
+        return None
+
+    return guild, get_guild_state(guild.id), member, None
 
 
 class GuidedFirstEventModal(discord.ui.Modal):
@@ -4706,7 +5377,7 @@ class GuidedFirstEventModal(discord.ui.Modal):
         # 2) Add the first event with the same limits the slash command enforces.
         g = get_guild_state(self.guild_id)
         cs = get_channel_state(self.guild_id, self.channel_id)
-        member = guild.get_member(interaction.user.id)
+        member = interaction.user  # already the resolved Member in a guild interaction
         msg, _nudge = await add_event_core(
             guild, g, cs, self.channel_id,
             actor=interaction.user, member=member,
@@ -4839,12 +5510,7 @@ async def seteventchannel(interaction: discord.Interaction):
         return
 
     # ✅ Defense-in-depth: verify perms via resolved Member object
-    member = interaction.user
-    if not isinstance(member, discord.Member):
-        member = guild.get_member(interaction.user.id) or member  # best effort
-
-    perms = getattr(member, "guild_permissions", None)
-    if not perms or not (perms.manage_guild or perms.administrator):
+    if not _actor_can_manage(interaction):
         await interaction.edit_original_response(
             content="You need **Manage Server** (or **Administrator**) to change the event channel."
         )
@@ -4888,11 +5554,7 @@ async def setstreakchannel(interaction: discord.Interaction):
         )
         return
 
-    member = interaction.user
-    if not isinstance(member, discord.Member):
-        member = guild.get_member(interaction.user.id) or member
-    perms = getattr(member, "guild_permissions", None)
-    if not perms or not (perms.manage_guild or perms.administrator):
+    if not _actor_can_manage(interaction):
         await interaction.edit_original_response(
             content="You need **Manage Server** (or **Administrator**) to set up a streak channel."
         )
@@ -4914,43 +5576,11 @@ async def setstreakchannel(interaction: discord.Interaction):
 @app_commands.autocomplete(template=streak_template_autocomplete)
 async def addstreak(interaction: discord.Interaction, date: str, template: Optional[str] = None, name: Optional[str] = None):
     await interaction.response.defer(ephemeral=True)
-    user = interaction.user
 
-    if interaction.guild is not None:
-        guild = interaction.guild
-        member = interaction.user
-        if not isinstance(member, discord.Member):
-            member = guild.get_member(user.id)
-            if member is None:
-                try:
-                    member = await guild.fetch_member(user.id)
-                except Exception:
-                    member = None
-        perms = getattr(member, "guild_permissions", None)
-        if not perms or not (perms.manage_guild or perms.administrator):
-            await interaction.edit_original_response(
-                content="You need the **Manage Server** or **Administrator** permission to add streaks in this server."
-            )
-            return
-        guild_state = get_guild_state(guild.id)
-        target_channel_id = interaction.channel_id
-    else:
-        user_links = get_user_links()
-        linked_guild_id = user_links.get(str(user.id))
-        if not linked_guild_id:
-            await interaction.edit_original_response(
-                content="I don't know which server to use for your DMs yet.\nIn the server, run `/linkserver`, then DM me `/addstreak` again."
-            )
-            return
-        guild = bot.get_guild(linked_guild_id)
-        if not guild:
-            await interaction.edit_original_response(
-                content="I can't find the linked server anymore. Re-add me and run `/linkserver` again."
-            )
-            return
-        guild_state = get_guild_state(guild.id)
-        member = guild.get_member(user.id)
-        target_channel_id = None
+    target = await resolve_manage_target(interaction, "/addstreak", "streaks")
+    if target is None:
+        return
+    guild, guild_state, member, target_channel_id = target
 
     cid, cs = resolve_streak_channel(guild_state, target_channel_id)
     if cs is None:
@@ -4962,7 +5592,7 @@ async def addstreak(interaction: discord.Interaction, date: str, template: Optio
         return
 
     msg, _nudge = await add_streak_core(
-        guild, guild_state, cs, cid, actor=user, member=member, date=date, name=name, template=template
+        guild, guild_state, cs, cid, actor=interaction.user, member=member, date=date, name=name, template=template
     )
     await interaction.edit_original_response(content=msg)
 
@@ -5005,6 +5635,51 @@ async def streak_index_autocomplete(interaction: discord.Interaction, current: s
     return choices
 
 
+async def resolve_streak_target(interaction: discord.Interaction, index: Optional[int], cmd: str, verb: str):
+    """Shared prologue for /resetstreak + /removestreak (after defer): checks Manage Server,
+    finds the streak board, and picks the streak by board index (or the only one). Replies
+    with the right error and returns None on any miss, else (guild_state, cid, cs, target)."""
+    guild = interaction.guild
+    if guild is None:
+        await interaction.edit_original_response(content=f"Run `{cmd}` inside the server's streak channel.")
+        return None
+
+    if not _actor_can_manage(interaction):
+        await interaction.edit_original_response(
+            content=f"You need **Manage Server** (or **Administrator**) to {verb} a streak."
+        )
+        return None
+
+    guild_state = get_guild_state(guild.id)
+    cid, cs = resolve_streak_channel(guild_state, interaction.channel_id)
+    if cs is None:
+        await interaction.edit_original_response(
+            content=f"No streak board here. Run `{cmd}` inside your streak channel."
+        )
+        return None
+
+    streaks = _ordered_streaks(cs)
+    if not streaks:
+        await interaction.edit_original_response(content="There are no streaks on this board yet.")
+        return None
+
+    if index is None:
+        if len(streaks) != 1:
+            listing = "\n".join(f"**{i}.** {ev.get('name')}" for i, ev in enumerate(streaks, start=1))
+            await interaction.edit_original_response(
+                content=f"This board has multiple streaks — run `{cmd}` again and pick one from the **index** list:\n{listing}"
+            )
+            return None
+        index = 1
+
+    if not 1 <= index <= len(streaks):
+        await interaction.edit_original_response(
+            content="That streak number isn't on this board — open the **index** picker to see the list."
+        )
+        return None
+    return guild_state, cid, cs, streaks[index - 1]
+
+
 def build_streak_reset_message(name: str) -> str:
     """Public, supportive 'streak was reset' announcement for the channel. Restarts are
     framed as a fresh start, never a failure, and the resetter is NOT named — it rallies
@@ -5034,55 +5709,16 @@ def build_streak_removed_message(name: str, days: int) -> str:
 @app_commands.guild_only()
 async def resetstreak(interaction: discord.Interaction, index: Optional[int] = None):
     await interaction.response.defer(ephemeral=True)
-    guild = interaction.guild
-    if guild is None:
-        await interaction.edit_original_response(content="Run `/resetstreak` inside the server's streak channel.")
-        return
-
-    member = interaction.user
-    if not isinstance(member, discord.Member):
-        member = guild.get_member(interaction.user.id) or member
-    perms = getattr(member, "guild_permissions", None)
-    if not perms or not (perms.manage_guild or perms.administrator):
-        await interaction.edit_original_response(
-            content="You need **Manage Server** (or **Administrator**) to reset a streak."
-        )
-        return
-
-    guild_state = get_guild_state(guild.id)
-    cid, cs = resolve_streak_channel(guild_state, interaction.channel_id)
-    if cs is None:
-        await interaction.edit_original_response(
-            content="No streak board here. Run `/resetstreak` inside your streak channel."
-        )
-        return
-
-    streaks = _ordered_streaks(cs)
-    if not streaks:
-        await interaction.edit_original_response(content="There are no streaks on this board yet.")
-        return
-
-    if index is not None:
-        target = streaks[index - 1] if 1 <= index <= len(streaks) else None
-    elif len(streaks) == 1:
-        target = streaks[0]
-    else:
-        listing = "\n".join(f"**{i}.** {ev.get('name')}" for i, ev in enumerate(streaks, start=1))
-        await interaction.edit_original_response(
-            content=f"This board has multiple streaks — run `/resetstreak` again and pick one from the **index** list:\n{listing}"
-        )
-        return
-
-    if target is None:
-        await interaction.edit_original_response(
-            content="That streak number isn't on this board — open the **index** picker to see the list."
-        )
+    resolved = await resolve_streak_target(interaction, index, "/resetstreak", "reset")
+    if resolved is None:
         return
+    guild_state, cid, cs, target = resolved
 
     tz = get_guild_timezone(cs)
     now = datetime.now(tz)
     target["timestamp"] = int(now.timestamp())
     target["announced_milestones"] = []
+    reposition_event(cs, target)
     save_state()
 
     channel = await get_text_channel(cid)
@@ -5162,50 +5798,10 @@ class StreakRemoveConfirmView(discord.ui.View):
 @app_commands.guild_only()
 async def removestreak(interaction: discord.Interaction, index: Optional[int] = None):
     await interaction.response.defer(ephemeral=True)
-    guild = interaction.guild
-    if guild is None:
-        await interaction.edit_original_response(content="Run `/removestreak` inside the server's streak channel.")
-        return
-
-    member = interaction.user
-    if not isinstance(member, discord.Member):
-        member = guild.get_member(interaction.user.id) or member
-    perms = getattr(member, "guild_permissions", None)
-    if not perms or not (perms.manage_guild or perms.administrator):
-        await interaction.edit_original_response(
-            content="You need **Manage Server** (or **Administrator**) to remove a streak."
-        )
-        return
-
-    guild_state = get_guild_state(guild.id)
-    cid, cs = resolve_streak_channel(guild_state, interaction.channel_id)
-    if cs is None:
-        await interaction.edit_original_response(
-            content="No streak board here. Run `/removestreak` inside your streak channel."
-        )
-        return
-
-    streaks = _ordered_streaks(cs)
-    if not streaks:
-        await interaction.edit_original_response(content="There are no streaks on this board yet.")
-        return
-
-    if index is None:
-        if len(streaks) == 1:
-            index = 1
-        else:
-            listing = "\n".join(f"**{i}.** {ev.get('name')}" for i, ev in enumerate(streaks, start=1))
-            await interaction.edit_original_response(
-                content=f"This board has multiple streaks — run `/removestreak` again and pick one from the **index** list:\n{listing}"
-            )
-            return
-
-    target = streaks[index - 1] if 1 <= index <= len(streaks) else None
-    if target is None:
-        await interaction.edit_original_response(
-            content="That streak number isn't on this board — open the **index** picker to see the list."
-        )
+    resolved = await resolve_streak_target(interaction, index, "/removestreak", "remove")
+    if resolved is None:
         return
+    _guild_state, cid, cs, target = resolved
 
     # Day count for the confirmation prompt, measured now (the count won't have moved
     # by the time they confirm seconds later).
@@ -5227,7 +5823,7 @@ async def removestreak(interaction: discord.Interaction, index: Optional[int] =
                          f"Just want to start the count over instead? Use `/resetstreak` — it keeps the streak."),
             color=discord.Color.red(),
         ),
-        view=StreakRemoveConfirmView(guild.id, cid, target, name, days),
+        view=StreakRemoveConfirmView(interaction.guild_id, cid, target, name, days),
     )
 
 
@@ -5236,17 +5832,15 @@ def parse_streak_milestones(text: str):
     if nothing usable was given. (Yearly anniversaries always fire regardless.)"""
     if not text or not text.strip():
         return None
-    out = []
-    for tok in text.replace(",", " ").replace(";", " ").split():
-        try:
+    seen = set()
+    try:
+        for tok in text.replace(",", " ").replace(";", " ").split():
             n = int(tok)
-        except ValueError:
-            return None
-        if n > 0:
-            out.append(n)
-    if not out:
+            if n > 0:
+                seen.add(n)
+    except ValueError:
         return None
-    return sorted(set(out))
+    return sorted(seen) or None
 
 
 @bot.tree.command(name="setstreakmilestones", description="Customize which day-counts your streak board celebrates (Pro).")
@@ -5293,9 +5887,7 @@ async def setstreakmilestones(interaction: discord.Interaction, milestones: str)
 
     save_state()
 
-    channel = await get_text_channel(cid)
-    if channel is not None:
-        await rebuild_pinned_message_for_channel(channel, cs, guild_state)
+    schedule_pinned_rebuild_for_id(cid, cs, guild_state)
 
     pretty = ", ".join(str(m) for m in ladder)
     await interaction.edit_original_response(
@@ -5426,7 +6018,7 @@ async def linkserver(interaction: discord.Interaction):
     assert guild is not None
 
     user_links = get_user_links()
-    user_links[str(interaction.user.id)] = guild.id
+    user_links[interaction.user.id] = guild.id
     save_state()
 
     await interaction.response.send_message(
@@ -5844,11 +6436,8 @@ class CountdownTimezoneModal(discord.ui.Modal):
         self.add_item(self.tz_input)
 
     async def on_submit(self, interaction: discord.Interaction):
-        import pytz
         raw = str(self.tz_input.value).strip()
-        try:
-            pytz.timezone(raw)
-        except Exception:
+        if resolve_timezone(raw) is None:
             await interaction.response.send_message(
                 f"❌ `{raw}` isn't a valid timezone. Try e.g. `US/Eastern`, `Europe/London`, `UTC`.",
                 ephemeral=True,
@@ -6216,7 +6805,7 @@ async def countdown_hub(interaction: discord.Interaction):
 # when re-sorting shifts list indices.
 
 def _event_dt(ev: dict, tz) -> datetime:
-    return datetime.fromtimestamp(ev.get("timestamp", 0), tz=tz)
+    return event_local_dt(ev.get("timestamp", 0), tz)
 
 
 def build_event_hub_embed(cs: dict, guild_state: dict) -> discord.Embed:
@@ -6229,9 +6818,8 @@ def build_event_hub_embed(cs: dict, guild_state: dict) -> discord.Embed:
 def build_event_detail_embed(cs: dict, guild_state: dict, ev: dict) -> discord.Embed:
     tz = get_guild_timezone(cs)
     dt = _event_dt(ev, tz)
-    now = datetime.now(tz)
-    desc, _, passed = compute_time_left(now, dt)
-    miles = ", ".join(str(x) for x in ev.get("milestones", DEFAULT_MILESTONES)) or "—"
+    desc, _, passed = describe_time_left(int(ev.get("timestamp", 0) - time.time()))
+    miles = ", ".join(str(x) for x in event_milestones(ev)) or "—"
     repeat_every = ev.get("repeat_every_days")
     repeat_note = f"every {repeat_every} day(s)" if isinstance(repeat_every, int) and repeat_every > 0 else "off"
     owner_id = ev.get("owner_user_id")
@@ -6241,7 +6829,7 @@ def build_event_detail_embed(cs: dict, guild_state: dict, ev: dict) -> discord.E
     banner = "✅ set" if ev.get("banner_url") else "—"
 
     e = discord.Embed(title=f"🗓️ {str(ev.get('name', 'Event'))[:240]}", color=EMBED_COLOR)
-    e.add_field(name="When", value=dt.strftime("%B %d, %Y at %I:%M %p %Z"), inline=False)
+    e.add_field(name="When", value=discord.utils.format_dt(dt, "F"), inline=False)
     e.add_field(name="Countdown", value=(f"{desc} remaining" if not passed else "started / passed"), inline=False)
     e.add_field(name="🔔 Milestones", value=miles, inline=True)
     e.add_field(name="🕐 Reminder time", value=reminder, inline=True)
@@ -6312,14 +6900,12 @@ class EventDetailBackButton(discord.ui.Button):
 class EventListSelect(discord.ui.Select):
     def __init__(self, cs: dict):
         tz = get_guild_timezone(cs)
-        sort_events(cs)
         opts = []
         for i, ev in enumerate(cs.get("events", [])[:25]):
-            dt = _event_dt(ev, tz)
             opts.append(discord.SelectOption(
                 label=f"{i + 1}. {str(ev.get('name', 'Event'))[:80]}"[:100],
                 value=str(i),
-                description=dt.strftime("%m/%d/%Y %H:%M")[:100],
+                description=event_short_str(ev.get("timestamp", 0), tz)[:100],
             ))
         if not opts:
             opts = [discord.SelectOption(label="(no events yet — use Add event)", value="none")]
@@ -6333,7 +6919,6 @@ class EventListSelect(discord.ui.Select):
             return
         g = get_guild_state(gid)
         cs = get_channel_state(gid, cid)
-        sort_events(cs)
         idx = int(self.values[0])
         events = cs.get("events", [])
         if idx >= len(events):
@@ -6366,7 +6951,7 @@ class EventAddModal(discord.ui.Modal):
         g = get_guild_state(self.gid)
         cs = get_channel_state(self.gid, self.cid)
         guild = bot.get_guild(self.gid)
-        member = guild.get_member(interaction.user.id) if guild else None
+        member = interaction.user  # already the resolved Member in a guild interaction
         msg, _nudge = await add_event_core(
             guild, g, cs, self.cid,
             actor=interaction.user, member=member,
@@ -6419,9 +7004,8 @@ class EventEditModal(discord.ui.Modal):
         cs = get_channel_state(self.gid, self.cid)
         tz = get_guild_timezone(cs)
         ev = self.ev
-        name = str(self.name.value or "").strip()
-        if name:
-            ev["name"] = name
+        name = str(self.name.value or "").strip() or ev.get("name")
+        new_ts = ev.get("timestamp")
         date = str(self.date.value or "").strip()
         time = str(self.time.value or "").strip()
         if date or time:
@@ -6429,17 +7013,26 @@ class EventEditModal(discord.ui.Modal):
             new_date = date or cur.strftime("%m/%d/%Y")
             new_time = time or cur.strftime("%H:%M")
             try:
-                dt = datetime.strptime(f"{new_date} {new_time}", "%m/%d/%Y %H:%M").replace(tzinfo=tz)
+                dt = parse_event_datetime(new_date, new_time, tz)
             except ValueError:
                 await interaction.response.send_message("Invalid date/time. Use MM/DD/YYYY + 24-hour HH:MM.", ephemeral=True)
                 return
-            if dt <= datetime.now(tz):
+            new_ts = int(dt.timestamp())
+            if new_ts != ev.get("timestamp") and dt <= interaction.created_at:
                 await interaction.response.send_message("That date/time is in the past. Choose a future time.", ephemeral=True)
                 return
-            ev["timestamp"] = int(dt.timestamp())
+
+        # The modal is prefilled, so a plain resubmit lands here — skip the save + board refresh.
+        if name == ev.get("name") and new_ts == ev.get("timestamp"):
+            await interaction.response.send_message("No changes — the event is unchanged.", ephemeral=True)
+            return
+
+        ev["name"] = name
+        if new_ts != ev.get("timestamp"):
+            ev["timestamp"] = new_ts
             ev["announced_milestones"] = []
             ev["announced_repeat_dates"] = []
-        sort_events(cs)
+            reposition_event(cs, ev)
         save_state()
         await interaction.response.send_message("✅ Event updated.", ephemeral=True)
         await _event_apply_via_parent(self.parent, self.gid, self.cid, ev, confirm="✅ Event updated.")
@@ -6452,7 +7045,7 @@ class EventMilestonesModal(discord.ui.Modal):
         self.days = discord.ui.TextInput(
             label="Milestone days",
             placeholder="100, 50, 30, 14, 7, 2, 1, 0",
-            default=", ".join(str(x) for x in ev.get("milestones", DEFAULT_MILESTONES)),
+            default=", ".join(str(x) for x in event_milestones(ev)),
             max_length=200,
         )
         self.add_item(self.days)
@@ -6489,9 +7082,9 @@ class EventMilestonesResetButton(discord.ui.Button):
         v = self.view
         cs = get_channel_state(v.guild_id, v.channel_id)
         defaults = cs.get("default_milestones")
-        if not isinstance(defaults, list) or not defaults:
+        if not isinstance(defaults, (list, tuple)) or not defaults:
             defaults = DEFAULT_MILESTONES
-        v.ev["milestones"] = list(defaults)
+        v.ev["milestones"] = defaults
         v.ev["announced_milestones"] = []
         save_state()
         await _event_apply(interaction, v.guild_id, v.channel_id, v.ev,
@@ -6658,7 +7251,7 @@ class EventRepeatModal(discord.ui.Modal):
             return
         cs = get_channel_state(self.gid, self.cid)
         self.ev["repeat_every_days"] = n
-        self.ev["repeat_anchor_date"] = _today_local_date(get_guild_timezone(cs)).isoformat()
+        self.ev["repeat_anchor_date"] = interaction.created_at.astimezone(get_guild_timezone(cs)).date().isoformat()
         self.ev["announced_repeat_dates"] = []
         save_state()
         await interaction.response.send_message(f"✅ Repeating every {n} day(s).", ephemeral=True)
@@ -6719,20 +7312,18 @@ class EventDupeModal(discord.ui.Modal):
         use_time = str(self.time.value or "").strip() or _event_dt(src, tz).strftime("%H:%M")
         use_name = str(self.name.value or "").strip() or src.get("name", "Event")
         try:
-            dt = datetime.strptime(f"{str(self.date.value).strip()} {use_time}", "%m/%d/%Y %H:%M").replace(tzinfo=tz)
+            dt = parse_event_datetime(str(self.date.value).strip(), use_time, tz)
         except ValueError:
             await interaction.response.send_message("Invalid date/time. Use MM/DD/YYYY + 24-hour HH:MM.", ephemeral=True)
             return
-        if dt <= datetime.now(tz):
+        if dt <= interaction.created_at:
             await interaction.response.send_message("That date/time is in the past. Choose a future time.", ephemeral=True)
             return
-        guild = bot.get_guild(self.gid)
-        maker = guild.get_member(interaction.user.id) if guild else None
-        maker_name = getattr(maker, "display_name", None) or interaction.user.name
+        maker_name = interaction.user.display_name
         new_ev = {
             "name": use_name,
             "timestamp": int(dt.timestamp()),
-            "milestones": (src.get("milestones") or DEFAULT_MILESTONES).copy(),
+            "milestones": src.get("milestones") or DEFAULT_MILESTONES,
             "announced_milestones": [],
             "repeat_every_days": src.get("repeat_every_days"),
             "repeat_anchor_date": None,
@@ -6746,11 +7337,10 @@ class EventDupeModal(discord.ui.Modal):
             "owner_user_id": int(interaction.user.id),
             "owner_name": maker_name,
         }
-        cs["events"].append(new_ev)
-        sort_events(cs)
+        insert_event(cs, new_ev)
         save_state()
         # Acknowledge before the network-bound pin refresh (3s window — see _event_apply).
-        await interaction.response.send_message(f"🧬 Duplicated → **{use_name}** on {dt.strftime('%B %d, %Y at %I:%M %p %Z')}.", ephemeral=True)
+        await interaction.response.send_message(f"🧬 Duplicated → **{use_name}** on {format_long_datetime(dt)}.", ephemeral=True)
         try:
             await self.parent.edit_original_response(embed=build_event_hub_embed(cs, g), view=EventHubView(self.gid, self.cid))
         except Exception:
@@ -6916,18 +7506,16 @@ async def add_event_core(guild, guild_state, cs, cid, *, actor, member, date, ti
     tz = get_guild_timezone(cs)
 
     # EVENT LIMIT ENFORCEMENT (per countdown channel) — only count FUTURE events.
-    now = datetime.now(tz)
-    future_events = [
-        ev for ev in cs.get("events", [])
-        if datetime.fromtimestamp(ev.get("timestamp", 0), tz=tz) > now
-    ]
-    current_event_count = len(future_events)
+    # (`time` is the HH:MM argument here, not the module.)
+    now_ts = datetime.now(tz).timestamp()
+    events = cs.get("events", [])
+    current_event_count = len(events) - count_events_before(events, now_ts, inclusive=True)
 
     is_pro_guild = is_pro(guild_state)
     has_voted = await topgg_has_voted(actor.id, force=True)
 
     if has_voted:
-        nowu = datetime.now(timezone.utc)
+        nowu = datetime.fromtimestamp(now_ts, timezone.utc)
         sup = guild_state.setdefault("supporter", {})
         sup["last_vote_at"] = nowu.isoformat()
         sup["vote_until"] = (nowu + timedelta(hours=12)).isoformat()
@@ -6973,11 +7561,11 @@ async def add_event_core(guild, guild_state, cs, cid, *, actor, member, date, ti
         ), False
 
     try:
-        dt = datetime.strptime(f"{date} {time}", "%m/%d/%Y %H:%M").replace(tzinfo=tz)
+        dt = parse_event_datetime(date, time, tz)
     except ValueError:
         return ("I couldn't understand that date/time.\nUse: `date: 04/12/2026` `time: 09:00` (MM/DD/YYYY + 24-hour HH:MM).", False)
 
-    if dt <= datetime.now(tz):
+    if dt.timestamp() <= now_ts:
         return ("That date/time is in the past. Please choose a future time.", False)
 
     creator_display = getattr(member, "display_name", None) or actor.name
@@ -6988,7 +7576,7 @@ async def add_event_core(guild, guild_state, cs, cid, *, actor, member, date, ti
         "timestamp": int(dt.timestamp()),
         "owner_id": actor.id,
         "owner_tag": str(actor),
-        "milestones": cs.get("default_milestones", DEFAULT_MILESTONES.copy()).copy(),
+        "milestones": cs.get("default_milestones", DEFAULT_MILESTONES),
         "announced_milestones": [],
         "milestone_messages": [],
         "milestones_cleaned": False,
@@ -7005,17 +7593,14 @@ async def add_event_core(guild, guild_state, cs, cid, *, actor, member, date, ti
         "start_announced": False,
     }
 
-    cs["events"].append(event)
-    sort_events(cs)
+    insert_event(cs, event)
     _mark_stint_activation(guild_state)  # per-stint churn diagnostics
     save_state()
 
-    channel = await get_text_channel(cid)
-    if channel is not None:
-        await rebuild_pinned_message_for_channel(channel, cs, guild_state)
+    schedule_pinned_rebuild_for_id(cid, cs, guild_state)
 
     msg = (
-        f"✅ Added event **{name}** on {dt.strftime('%B %d, %Y at %I:%M %p %Z')} in server **{guild.name}**.\n"
+        f"✅ Added event **{name}** on {format_long_datetime(dt)} in server **{guild.name}**.\n"
         f"• {tier_name}: {len(cs['events'])}/{event_limit if event_limit else '∞'} events"
     )
     nudge = tier_name == "Free" and len(cs["events"]) >= 1
@@ -7032,8 +7617,7 @@ async def add_streak_core(guild, guild_state, cs, cid, *, actor, member, date, n
     now = datetime.now(tz)
 
     # LIMIT: streaks per board — Free = 1, Voted = 1 (NO vote-boost), Pro = unlimited.
-    existing_streaks = [ev for ev in cs.get("events", []) if is_streak_event(ev)]
-    if not is_pro(guild_state) and len(existing_streaks) >= 1:
+    if not is_pro(guild_state) and any(is_streak_event(ev) for ev in cs.get("events", [])):
         return (
             "💎 **One streak is free — more is a Chromie Pro perk.**\n\n"
             "You're already tracking a streak on this board. **Chromie Pro ($2.99/month)** unlocks "
@@ -7063,7 +7647,7 @@ async def add_streak_core(guild, guild_state, cs, cid, *, actor, member, date, n
 
     # PARSE the start date (date only — a streak counts up from a day, not a minute).
     try:
-        dt = datetime.strptime(date, "%m/%d/%Y").replace(tzinfo=tz)
+        dt = parse_event_date(date, tz)
     except ValueError:
         return ("I couldn't understand that date.\nUse: `date: 04/12/2026` (MM/DD/YYYY).", False)
 
@@ -7105,14 +7689,11 @@ async def add_streak_core(guild, guild_state, cs, cid, *, actor, member, date, n
         "start_announced": True,  # streaks have no "zero hour" blast; milestone 1 is the kickoff
         "template": template if tmpl is not None else None,  # drives bespoke milestone copy
     }
-    cs["events"].append(streak)
-    sort_events(cs)
+    insert_event(cs, streak)
     _mark_stint_activation(guild_state, kind="streak")  # per-stint churn diagnostics
     save_state()
 
-    channel = await get_text_channel(cid)
-    if channel is not None:
-        await rebuild_pinned_message_for_channel(channel, cs, guild_state)
+    schedule_pinned_rebuild_for_id(cid, cs, guild_state)
 
     day_word = "day" if days_since == 1 else "days"
     msg = (
@@ -7130,65 +7711,12 @@ async def add_streak_core(guild, guild_state, cs, cid, *, actor, member, date, n
 )
 async def addevent(interaction: discord.Interaction, date: str, time: str, name: str):
     await interaction.response.defer(ephemeral=True)
-    user = interaction.user
-
-    if interaction.guild is not None:
-        guild = interaction.guild
-
-        member = interaction.user
-        if not isinstance(member, discord.Member):
-            member = guild.get_member(user.id)
-
-        if member is None:
-            try:
-                member = await guild.fetch_member(user.id)
-            except Exception:
-                member = None
 
-        perms = getattr(member, "guild_permissions", None)
-        if not perms or not (perms.manage_guild or perms.administrator):
-            await interaction.edit_original_response(
-                content="You need the **Manage Server** or **Administrator** permission to add events in this server."
-            )
-            return
-
-        guild_state = get_guild_state(guild.id)
-        is_dm = False
-        target_channel_id = interaction.channel_id
-
-    else:
-        user_links = get_user_links()
-        linked_guild_id = user_links.get(str(user.id))
-        if not linked_guild_id:
-            await interaction.edit_original_response(
-                content="I don't know which server to use for your DMs yet.\nIn the server you want to control, run `/linkserver`, then DM me `/addevent` again."
-            )
-            return
-
-        guild = bot.get_guild(linked_guild_id)
-        if not guild:
-            await interaction.edit_original_response(
-                content="I can't find the linked server anymore. Maybe I was removed from it?\nRe-add me and run `/linkserver` again."
-            )
-            return
-
-        member = guild.get_member(user.id)
-        if member is None:
-            try:
-                member = await guild.fetch_member(user.id)
-            except Exception:
-                member = None
-
-        perms = getattr(member, "guild_permissions", None)
-        if not perms or not (perms.manage_guild or perms.administrator):
-            await interaction.edit_original_response(
-                content="You no longer have **Manage Server** (or **Administrator**) in the linked server, so I can’t add events via DM."
-            )
-            return
-
-        guild_state = get_guild_state(guild.id)
-        is_dm = True
-        target_channel_id = None  # DM has no "current channel"; resolve below
+    target = await resolve_manage_target(interaction, "/addevent", "events")
+    if target is None:
+        return
+    guild, guild_state, member, target_channel_id = target
+    is_dm = target_channel_id is None
 
     # Resolve which countdown channel this event belongs to.
     cid, cs = resolve_event_channel(guild_state, target_channel_id)
@@ -7249,26 +7777,20 @@ async def nextevent(interaction: discord.Interaction):
             no_channel_guidance(g, "/nextevent"), ephemeral=True
         )
         return
-    sort_events(cs)
 
     tz = get_guild_timezone(cs)
-    now = datetime.now(tz)
-    next_ev = None
-    for ev in cs.get("events", []):
-        dt = datetime.fromtimestamp(ev["timestamp"], tz=tz)
-        if dt > now:
-            next_ev = (ev, dt)
-            break
-
-    if not next_ev:
+    now_ts = time.time()
+    events = cs["events"]
+    # Events are kept in timestamp order, so the next one is a binary search away.
+    ev = first_event_after(events, now_ts)
+    if ev is None:
         await interaction.response.send_message("No upcoming events found.", ephemeral=True)
         return
 
-    ev, dt = next_ev
-    desc, _, _ = compute_time_left(now, dt)
+    dt, desc, _, _ = event_view(ev, tz, now_ts)
     await interaction.response.send_message(
         f"⏭️ Next event: **{ev['name']}**\n"
-        f"🗓️ {dt.strftime('%B %d, %Y at %I:%M %p %Z')}\n"
+        f"🗓️ {discord.utils.format_dt(dt, 'F')}\n"
         f"⏱️ {desc} remaining",
         ephemeral=True,
     )
@@ -7299,7 +7821,6 @@ async def remindall(interaction: discord.Interaction, index: Optional[int] = Non
     if cs is None:
         await interaction.edit_original_response(content=no_channel_guidance(g, "/remindall"))
         return
-    sort_events(cs)
 
     channel = await get_text_channel(cid)
     if channel is None:
@@ -7311,28 +7832,19 @@ async def remindall(interaction: discord.Interaction, index: Optional[int] = Non
         await interaction.edit_original_response(content="I couldn't resolve my own permissions in this server.")
         return
 
-    ev = None
-    dt = None
-
     tz = get_guild_timezone(cs)
-
-    now = datetime.now(tz)
+    now_ts = time.time()
 
     if index is not None:
         ev = get_event_by_index(cs, index)
         if not ev:
             await interaction.edit_original_response(content="Invalid index. Use `/listevents`.")
             return
-        dt = datetime.fromtimestamp(ev["timestamp"], tz=tz)
     else:
-        for candidate in cs.get("events", []):
-            cdt = datetime.fromtimestamp(candidate["timestamp"], tz=tz)
-            if cdt > now:
-                ev = candidate
-                dt = cdt
-                break
+        events = cs["events"]
+        ev = first_event_after(events, now_ts)
 
-    if not ev or not dt:
+    if not ev:
         await interaction.edit_original_response(content="No upcoming event found to remind about.")
         return
 
@@ -7340,7 +7852,7 @@ async def remindall(interaction: discord.Interaction, index: Optional[int] = Non
         await interaction.edit_original_response(content="That event is currently silenced (use `/event` → Silence to toggle it back on).")
         return
 
-    desc, _, passed = compute_time_left(now, dt)
+    dt, desc, _, passed = event_view(ev, tz, now_ts)
     if passed:
         await interaction.edit_original_response(content="That event has already started or passed.")
         return
@@ -7354,7 +7866,7 @@ async def remindall(interaction: discord.Interaction, index: Optional[int] = Non
     else:
         mention_prefix, allowed = build_milestone_mention(channel, cs)
 
-    date_str = dt.strftime("%B %d, %Y at %I:%M %p %Z")
+    date_str = format_long_datetime(dt)
     body = build_remindall_message(cs, event_name=ev["name"], time_left=desc, date_str=date_str)
     msg = f"{mention_prefix}{body}"
 
@@ -7414,7 +7926,7 @@ async def template_save_cmd(interaction: discord.Interaction, index: int, name:
     templates = g.setdefault("templates", {})
     templates[key] = {
         "display_name": name.strip(),
-        "milestones": (ev.get("milestones") or DEFAULT_MILESTONES).copy(),
+        "milestones": ev.get("milestones") or DEFAULT_MILESTONES,
         "repeat_every_days": ev.get("repeat_every_days"),
         "silenced": bool(ev.get("silenced", False)),
     }
@@ -7451,22 +7963,21 @@ async def template_load_cmd(interaction: discord.Interaction, name: str, date: s
         return
 
     try:
-        dt = datetime.strptime(f"{date} {time}", "%m/%d/%Y %H:%M").replace(tzinfo=tz)
+        dt = parse_event_datetime(date, time, tz)
     except ValueError:
         await interaction.response.send_message("Invalid date/time. Use MM/DD/YYYY + 24-hour HH:MM.", ephemeral=True)
         return
 
-    if dt <= datetime.now(tz):
+    if dt <= interaction.created_at:
         await interaction.response.send_message("That date/time is in the past. Choose a future time.", ephemeral=True)
         return
 
-    maker = guild.get_member(interaction.user.id)
-    maker_name = maker.display_name if maker else interaction.user.name
+    maker_name = interaction.user.display_name
 
     new_ev = {
         "name": event_name,
         "timestamp": int(dt.timestamp()),
-        "milestones": list(tpl.get("milestones") or DEFAULT_MILESTONES),
+        "milestones": tpl.get("milestones") or DEFAULT_MILESTONES,
         "announced_milestones": [],
         "repeat_every_days": tpl.get("repeat_every_days"),
         "repeat_anchor_date": None,
@@ -7481,8 +7992,7 @@ async def template_load_cmd(interaction: discord.Interaction, name: str, date: s
         "owner_name": maker_name,
     }
 
-    cs["events"].append(new_ev)
-    sort_events(cs)
+    insert_event(cs, new_ev)
     save_state()
     # Acknowledge before the network-bound pin rebuild (3s window — see _event_apply).
     await interaction.response.send_message(
@@ -7491,7 +8001,7 @@ async def template_load_cmd(interaction: discord.Interaction, name: str, date: s
     )
     ch = await get_text_channel(cid)
     if ch:
-        await rebuild_pinned_message_for_channel(ch, cs, g)
+        schedule_pinned_rebuild(ch, cs, g)
 def _clean_url(u: str) -> str:
     u = (u or "").strip()
     # allow people to paste <https://...>
@@ -7538,16 +8048,22 @@ async def archivepast(interaction: discord.Interaction):
 
     g = get_guild_state(guild.id)
     removed = 0
+    now_ts = time.time()
     for cid, cs in iter_channel_states(g):
-        tz = get_guild_timezone(cs)
-        now = datetime.now(tz)
-        before = len(cs.get("events", []))
-        cs["events"] = [ev for ev in cs.get("events", []) if datetime.fromtimestamp(ev["timestamp"], tz=tz) > now]
-        if len(cs["events"]) != before:
-            removed += before - len(cs["events"])
+        events = cs["events"]
+        # Sorted by timestamp, so everything past is a prefix.
+        cut = bisect_events(events, now_ts, right=True, fallback=None)
+        if cut is None:  # unsortable old state; drop past events one by one
+            kept = [ev for ev in events if not (_has_timestamp(ev) and ev["timestamp"] <= now_ts)]
+            cut = len(events) - len(kept)
+        else:
+            kept = events[cut:]
+        if cut:
+            cs["events"] = kept
+            removed += cut
             ch = await get_text_channel(cid)
             if ch:
-                await rebuild_pinned_message_for_channel(ch, cs, g)
+                schedule_pinned_rebuild(ch, cs, g)
     save_state()
 
     await interaction.edit_original_response(content=f"🧹 Archived **{removed}** past event(s) across this server's countdown channels.")
@@ -7555,6 +8071,16 @@ async def archivepast(interaction: discord.Interaction):
 
 
 
+# (label, Permissions attribute) pairs reported per channel by /healthcheck.
+_HEALTHCHECK_PERMS = (
+    ("view", "view_channel"),
+    ("send", "send_messages"),
+    ("embed", "embed_links"),
+    ("history", "read_message_history"),
+    ("pin", "manage_messages"),
+)
+
+
 @bot.tree.command(name="healthcheck", description="Show config + permission diagnostics.")
 @app_commands.checks.has_permissions(manage_guild=True)
 @app_commands.guild_only()
@@ -7583,9 +8109,8 @@ async def healthcheck(interaction: discord.Interaction):
         lines.append(f"\n{ch.mention} — {n_events} event(s)")
         if bot_member:
             perms = ch.permissions_for(bot_member)
-            lines.append(f"• view {'✅' if perms.view_channel else '❌'} • send {'✅' if perms.send_messages else '❌'} "
-                         f"• embed {'✅' if perms.embed_links else '❌'} • history {'✅' if perms.read_message_history else '❌'} "
-                         f"• pin {'✅' if perms.manage_messages else '❌'}")
+            lines.append(" ".join(f"• {label} {'✅' if getattr(perms, attr) else '❌'}"
+                                  for label, attr in _HEALTHCHECK_PERMS))
         role_id = cs.get("mention_role_id")
         if role_id:
             role = guild.get_role(int(role_id))
@@ -7619,7 +8144,7 @@ async def purgeevents(interaction: discord.Interaction, confirm: str):
 
     ch = await get_text_channel(cid)
     if ch:
-        await rebuild_pinned_message_for_channel(ch, cs, g)
+        schedule_pinned_rebuild(ch, cs, g)
 
     await interaction.edit_original_response(content=f"🧨 All events deleted in <#{cid}>.")
 
@@ -8041,7 +8566,7 @@ async def _broadcast_launch_announcement(embed: discord.Embed, *, confirm: bool,
                 await channel.send(embed=embed, view=view, allowed_mentions=discord.AllowedMentions.none())
                 done.append(str(cid))
                 sent += 1
-                save_state()  # persist progress so a restart resumes
+                await save_state_async()  # persist progress so a restart resumes
                 if throttle:
                     await asyncio.sleep(throttle)
             except Exception as e:
@@ -8149,8 +8674,8 @@ async def prune_state(interaction: discord.Interaction, confirm: bool = False):
     ts = datetime.now(DEFAULT_TZ).strftime("%Y%m%d-%H%M%S")
     backup_path = DATA_FILE.with_suffix(DATA_FILE.suffix + f".bak.prune.{ts}")
     try:
-        with open(backup_path, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2, ensure_ascii=False)
+        raw = _dump_state_bytes(state, pretty=True, compress=False)
+        await asyncio.to_thread(backup_path.write_bytes, raw)
     except Exception as e:
         await interaction.followup.send(
             f"⚠️ **Aborted** — couldn't write the backup ({type(e).__name__}: {e}). No changes made.",
@@ -8158,7 +8683,7 @@ async def prune_state(interaction: discord.Interaction, confirm: bool = False):
         return
 
     result = _prune_departed(state, current)
-    save_state()
+    await save_state_async()
     await interaction.followup.send(
         f"🧹 **Pruned!**\n"
         f"• Removed **{result['removed_guilds']}** departed servers "
@@ -8168,6 +8693,50 @@ async def prune_state(interaction: discord.Interaction, confirm: bool = False):
         ephemeral=True)
 
 
+# Discord's attachment limit outside a boosted guild (e.g. when run from a DM).
+EXPORT_UPLOAD_LIMIT_BYTES = 10 * 1024 * 1024
+
+
+@bot.tree.command(name="export_state", description="[Owner] Download a readable (pretty-printed) copy of the state file.")
+async def export_state(interaction: discord.Interaction):
+    # The live file is written compact; this is the on-demand human-readable view.
+    if not await _is_bot_owner(interaction):
+        await interaction.response.send_message("❌ Owner only.", ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=True, thinking=True)
+    # Indented JSON runs several times the size of the compact live file; past the
+    # upload limit, send it gzipped rather than have Discord reject it with a 413.
+    limit = interaction.guild.filesize_limit if interaction.guild else EXPORT_UPLOAD_LIMIT_BYTES
+    ts = datetime.now(DEFAULT_TZ).strftime("%Y%m%d-%H%M%S")
+    filename = f"chromie_state.{ts}.json"
+    try:
+        raw = await asyncio.to_thread(_dump_state_bytes, state, pretty=True, compress=False)
+        if len(raw) > limit:
+            raw = await asyncio.to_thread(gzip.compress, raw, compresslevel=6)
+            filename += ".gz"
+    except Exception as e:
+        await interaction.followup.send(f"⚠️ Couldn't serialize state ({type(e).__name__}: {e}).", ephemeral=True)
+        return
+
+    if len(raw) > limit:
+        await interaction.followup.send(
+            f"⚠️ State export is too large to upload ({len(raw) / 1024 / 1024:.1f} MB gzipped, "
+            f"limit {limit / 1024 / 1024:.0f} MB). Grab `{DATA_FILE.name}` from the disk instead.",
+            ephemeral=True,
+        )
+        return
+
+    try:
+        await interaction.followup.send(
+            f"📦 State export — {len(state.get('guilds', {}))} guild entries.",
+            file=discord.File(io.BytesIO(raw), filename=filename),
+            ephemeral=True,
+        )
+    except discord.HTTPException as e:
+        await interaction.followup.send(f"⚠️ Couldn't upload the export ({e.status}: {e.text or e}).", ephemeral=True)
+
+
 # ==========================
 # RUN — MUST stay last. bot.run() blocks the event loop, so EVERY @bot.tree.command
 # must be defined above this point or it will never register (this is exactly why
@@ -10,6 +10,7 @@ Run from repo root:  python tests/test_engine.py
 import os
 import sys
 import json
+import gzip
 import asyncio
 import tempfile
 from pathlib import Path
@@ -81,6 +82,223 @@ def test_update_loop_runs_one_cycle_per_real_channel():
     assert all(isinstance(cid, int) for _, cid in calls)
 
 
+def test_render_key_stable_until_an_event_passes():
+    cs = {"time_unit": "discord", "events": [
+        {"name": "A", "timestamp": 1000}, {"name": "B", "timestamp": 2000}]}
+    k1 = chromie.countdown_render_key(cs, 500)
+    assert chromie.countdown_render_key(cs, 900) == k1, "discord mode key moved with the clock"
+    assert chromie.countdown_render_key(cs, 1500) != k1, "key ignored an event going past"
+    cs["theme"] = "neon"
+    assert chromie.countdown_render_key(cs, 500) != k1, "key ignored a theme change"
+
+
+def test_prune_past_events_drops_only_the_stale_prefix():
+    from datetime import datetime, timezone
+    now = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    now_ts = int(now.timestamp())
+    keep = max(chromie.STARTED_EVENT_KEEP_SECONDS, chromie.EVENT_START_GRACE_SECONDS)
+    bucket = {"timezone": "UTC", "events": [
+        {"name": "stale", "timestamp": now_ts - keep - 10},
+        {"name": "just started", "timestamp": now_ts - 5},
+        {"name": "future", "timestamp": now_ts + 3600},
+    ]}
+    assert chromie.prune_past_events(bucket, now=now) == 1
+    assert [e["name"] for e in bucket["events"]] == ["just started", "future"]
+    assert chromie.prune_past_events(bucket, now=now) == 0, "second pass should be a no-op"
+
+
+def _timestamps(bucket):
+    return [e["timestamp"] for e in bucket["events"]]
+
+
+def test_insert_event_keeps_bucket_sorted_out_of_order():
+    bucket = {"events": []}
+    for ts in (300, 100, 500, 200, 400):
+        chromie.insert_event(bucket, {"name": str(ts), "timestamp": ts})
+    assert _timestamps(bucket) == [100, 200, 300, 400, 500]
+
+
+def test_insert_event_equal_timestamps_keep_insertion_order():
+    bucket = {"events": []}
+    for name in ("first", "second", "third"):
+        chromie.insert_event(bucket, {"name": name, "timestamp": 100})
+    chromie.insert_event(bucket, {"name": "early", "timestamp": 50})
+    assert [e["name"] for e in bucket["events"]] == ["early", "first", "second", "third"]
+
+
+def test_reposition_event_moves_edited_event_earlier_and_later():
+    bucket = {"events": []}
+    for ts in (100, 200, 300, 400):
+        chromie.insert_event(bucket, {"name": str(ts), "timestamp": ts})
+    ev = bucket["events"][2]  # 300
+
+    ev["timestamp"] = 50
+    chromie.reposition_event(bucket, ev)
+    assert _timestamps(bucket) == [50, 100, 200, 400]
+    assert bucket["events"][0] is ev
+
+    ev["timestamp"] = 900
+    chromie.reposition_event(bucket, ev)
+    assert _timestamps(bucket) == [100, 200, 400, 900]
+    assert bucket["events"][-1] is ev
+
+    ev["timestamp"] = 250  # lands between neighbours after moving back
+    chromie.reposition_event(bucket, ev)
+    assert _timestamps(bucket) == [100, 200, 250, 400]
+    assert len(bucket["events"]) == 4, "reposition duplicated or dropped the event"
+
+    ev["timestamp"] = 260  # still fits between its neighbours: left in place
+    chromie.reposition_event(bucket, ev)
+    assert _timestamps(bucket) == [100, 200, 260, 400]
+
+
+def test_bisect_helpers_on_a_sorted_bucket():
+    events = [{"timestamp": t} for t in (100, 200, 200, 300)]
+    assert chromie.bisect_events(events, 200) == 1
+    assert chromie.bisect_events(events, 200, right=True) == 3
+    assert chromie.count_events_before(events, 200) == 1
+    assert chromie.count_events_before(events, 200, inclusive=True) == 3
+    assert chromie.first_event_after(events, 200)["timestamp"] == 300
+    assert chromie.first_event_after(events, 200, inclusive=True) is events[1]
+    assert chromie.first_event_after(events, 300) is None
+
+
+def test_bisect_helpers_fall_back_on_malformed_timestamps():
+    # Old state can hold a string timestamp; the bisect raises and the list isn't sorted.
+    events = [{"timestamp": 300}, {"timestamp": 100}, {"timestamp": "soon"}, {"timestamp": 200}]
+    assert chromie.bisect_events(events, 150) == 0
+    assert chromie.bisect_events(events, 150, fallback=None) is None
+    assert chromie.count_events_before(events, 150) == 1
+    assert chromie.count_events_before(events, 200, inclusive=True) == 2
+    assert chromie.first_event_after(events, 150)["timestamp"] == 200
+    assert chromie.first_event_after(events, 300) is None
+
+
+def test_unchanged_board_is_repinned_not_reposted():
+    class FakeMessage:
+        def __init__(self, mid, pinned):
+            self.id = mid
+            self.pinned = pinned
+            self.pins = 0
+
+        async def pin(self):
+            self.pins += 1
+            self.pinned = True
+
+    class FakePerms:
+        manage_messages = True
+
+    class FakeChannel:
+        id = 777001
+        guild = object()
+
+        def __init__(self, msg):
+            self.msg = msg
+            self.sent = []
+
+        async def fetch_message(self, mid):
+            return self.msg
+
+        async def send(self, **kwargs):
+            self.sent.append(kwargs)
+            return FakeMessage(999, False)
+
+        def permissions_for(self, member):
+            return FakePerms()
+
+    async def fake_get_bot_member(guild):
+        return object()
+
+    g = chromie._default_guild_state()
+    cs = chromie._default_channel_state()
+    cs["events"] = [{"name": "Launch", "timestamp": 4102444800}]
+    sig = chromie.embed_signature(chromie.build_board_embed(cs, g))
+
+    orig = chromie.get_bot_member
+    chromie.get_bot_member = fake_get_bot_member
+    try:
+        for pinned in (False, True):
+            msg = FakeMessage(123, pinned)
+            channel = FakeChannel(msg)
+            cs["pinned_message_id"] = msg.id
+            chromie._board_embed_sigs[channel.id] = (msg.id, sig)
+            got = asyncio.run(chromie.rebuild_pinned_message_for_channel(
+                channel, cs, g, skip_if_unchanged=True))
+            assert got is msg, "unchanged board was reposted"
+            assert not channel.sent
+            assert msg.pinned
+            assert msg.pins == (0 if pinned else 1), f"pinned={pinned}: pin() called {msg.pins}x"
+    finally:
+        chromie.get_bot_member = orig
+        chromie._board_embed_sigs.pop(FakeChannel.id, None)
+
+
+def test_channel_miss_cached_only_when_channel_is_gone():
+    import discord
+
+    class FakeHTTPResponse:
+        def __init__(self, status, reason):
+            self.status = status
+            self.reason = reason
+
+    fetches = []
+    errors = {}
+
+    async def fake_fetch_channel(cid):
+        fetches.append(cid)
+        raise errors[cid]
+
+    errors[888001] = discord.HTTPException(FakeHTTPResponse(503, "Service Unavailable"), "outage")
+    errors[888002] = discord.NotFound(FakeHTTPResponse(404, "Not Found"), "Unknown Channel")
+
+    orig = chromie.bot.fetch_channel
+    chromie.bot.fetch_channel = fake_fetch_channel
+    try:
+        for cid in errors:
+            assert asyncio.run(chromie.get_text_channel(cid)) is None
+            assert asyncio.run(chromie.get_text_channel(cid)) is None
+        assert fetches.count(888001) == 2, "a transient error suppressed the next lookup"
+        assert fetches.count(888002) == 1, "a deleted channel was fetched again"
+    finally:
+        chromie.bot.fetch_channel = orig
+        for cid in errors:
+            chromie._channel_miss_at.pop(cid, None)
+
+
+def test_saving_unchanged_state_does_not_rewrite_the_file():
+    replaces = []
+    real_replace = os.replace
+
+    def counting_replace(src, dst):
+        replaces.append(dst)
+        real_replace(src, dst)
+
+    os.replace = counting_replace
+    try:
+        assert chromie._write_state_atomic()  # baseline: whatever is in memory now
+        before = chromie.DATA_FILE.stat()
+        replaces.clear()
+
+        assert chromie._write_state_atomic()
+        assert replaces == [], "identical state was written again"
+        after = chromie.DATA_FILE.stat()
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+        chromie.state["_write_skip_probe"] = 1  # a real change must still land
+        try:
+            assert chromie._write_state_atomic()
+            assert len(replaces) == 1, "changed state was not written"
+            raw = chromie.DATA_FILE.read_bytes()
+            if chromie.STATE_GZIP:
+                raw = gzip.decompress(raw)
+            assert b"_write_skip_probe" in raw
+        finally:
+            del chromie.state["_write_skip_probe"]
+            chromie._write_state_atomic()
+    finally:
+        os.replace = real_replace
+
+
 if __name__ == "__main__":
     failures = 0
     for name, fn in sorted(globals().items()):
@@ -63,6 +63,20 @@ class FakeGuild:
     name = "Test Guild"
 
 
+class FakeResponse:
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, content=None, **kw):
+        self.sent.append(content)
+
+
+class FakeInteraction:
+    def __init__(self, user=None):
+        self.user = user or FakeUser()
+        self.response = FakeResponse()
+
+
 def _add(gid, cid, *, date, time="09:00", name="Party"):
     g = chromie.get_guild_state(gid)
     cs = chromie.get_channel_state(gid, cid)
@@ -104,6 +118,59 @@ def test_add_event_core_rejects_past_and_bad_dates():
     assert chromie.get_channel_state(gid, cid)["events"] == []
 
 
+# ---- date parsing (must accept/reject exactly what strptime did) ----
+
+_DATE_CASES = [
+    # valid, incl. 1-digit fields and leap days
+    "04/05/2026", "4/5/2026", "12/31/2099", "02/29/2024", "02/29/2000",
+    # out of range / impossible days
+    "02/29/2023", "02/29/1900", "00/10/2026", "13/01/2026", "04/00/2026", "04/31/2026", "01/32/2026",
+    # non-numeric / wrong shape
+    "ab/cd/2026", "04/05/26", "04/05/20266", "004/05/2026", "+4/05/2026", "04/05/２０２６", "", " 04/05/2026",
+    # wrong separators
+    "04-05-2026", "04.05.2026", "04/05-2026", "04/05/2026/", "0405/2026",
+    # strptime quirks: %d's " 5" form, whitespace at the date/time join
+    "04/ 5/2026", "04/05/2026 ", "04/05/2026\t", " 4/05/2026",
+]
+_TIME_CASES = [
+    "09:00", "9:5", "00:00", "23:59",
+    "24:00", "12:60", "-1:00", "9", "09.00", "09-00", "09:00:00", "ab:cd", " 09:00", "09:00 ", "",
+    "\t09:00", "０9:00", "09:０0",
+]
+
+
+def _strptime_or_none(text, fmt):
+    from datetime import datetime, timezone
+    try:
+        return datetime.strptime(text, fmt).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def _parse_or_none(fn, *args):
+    try:
+        return fn(*args)
+    except ValueError:
+        return None
+
+
+def test_parse_event_datetime_matches_strptime():
+    from datetime import timezone
+    for d in _DATE_CASES:
+        for t in _TIME_CASES:
+            want = _strptime_or_none(f"{d} {t}", "%m/%d/%Y %H:%M")
+            got = _parse_or_none(chromie.parse_event_datetime, d, t, timezone.utc)
+            assert got == want, f"{d!r} {t!r}: strptime={want} parser={got}"
+
+
+def test_parse_event_date_matches_strptime():
+    from datetime import timezone
+    for d in _DATE_CASES:
+        want = _strptime_or_none(d, "%m/%d/%Y")
+        got = _parse_or_none(chromie.parse_event_date, d, timezone.utc)
+        assert got == want, f"{d!r}: strptime={want} parser={got}"
+
+
 # ---- embeds ----
 
 def test_event_detail_embed_renders():
@@ -156,6 +223,20 @@ def test_event_detail_and_subviews_construct():
     chromie.EventAddModal(gid, cid, None)
 
 
+# ---- modal submits ----
+
+def test_edit_modal_resubmit_without_changes_is_a_noop():
+    gid, cid = fresh_gid(), 1
+    _add(gid, cid, date="12/31/2099", name="A")
+    ev = chromie.get_channel_state(gid, cid)["events"][0]
+    ev["announced_milestones"] = [30]
+    inter = FakeInteraction()
+    # The modal is prefilled with the current name/date/time.
+    asyncio.run(chromie.EventEditModal(gid, cid, ev, None).on_submit(inter))
+    assert inter.response.sent and inter.response.sent[0].startswith("No changes"), inter.response.sent
+    assert ev["announced_milestones"] == [30], "no-op edit reset milestone announcements"
+
+
 if __name__ == "__main__":
     failures = 0
     for name, fn in sorted(globals().items()):